@@ -31,6 +31,8 @@ class LoggerConfig:
     rotate_when: str = "midnight"
     # Maximum number of backup logs to keep
     backup_count: int = 5
+    # Lowest level written to the log file, INFO/WARNING/ERROR
+    log_level: str = "INFO"
 
     def __post_init__(self):
         type_method_map = {
@@ -47,7 +49,8 @@ class LoggerConfig:
 
             # Default type is int
             get_method = type_method_map.get(field_type, "getint")
-            config_value = getattr(self.printer_config, get_method)(field_name)
+            config_value = getattr(self.printer_config, get_method)(
+                field_name, field_info.default)
             object.__setattr__(self, field_name, config_value)
 
 
@@ -156,6 +159,12 @@ class MMSLogger:
         self._handler = None
         self._initialize_handler()
 
+        try:
+            self.set_level(self.logger_config.log_level.upper())
+        except ValueError:
+            raise config.error(
+                f"Unknown log_level '{self.logger_config.log_level}'")
+
     def _initialize_handler(self):
         """Set up log file handler with proper paths."""
         log_dir = os.path.dirname(printer_adapter.get_klippy_logfile())
@@ -172,6 +181,15 @@ class MMSLogger:
             self._handler.close()
             self._handler = None
 
+    def set_level(self, level):
+        """
+        Set the lowest level written to the log file, level is a
+        logging constant or its name. Loggers below it skip formatting,
+        see create_logger().
+        """
+        if self._handler:
+            self._handler.setLevel(level)
+
     # def get_func_name(self):
     #     return sys._getframe().f_code.co_name
 
@@ -184,8 +202,9 @@ class MMSLogger:
             func_name: Calling function name
             message: Log message content
         """
-        if self._handler:
-            self._handler.enqueue_record(level, func_name, message)
+        handler = self._handler
+        if handler and level >= handler.level:
+            handler.enqueue_record(level, func_name, message)
 
     # Syntactic sugar methods
     def log_info(self, func_name, message):
@@ -207,18 +226,34 @@ class MMSLogger:
             console_output: Mirror logs to console
 
         Returns:
-            Configured logging function
+            Configured logging function, accepts lazy %-style args
+            like logging: logger("hash: %s", hash_str), the message
+            is only formatted if it is emitted.
+            logger.is_enabled() tells if any sink consumes the message
+            now, checked on every call, so teardown() or the handler
+            level set later are followed.
         """
         log_method = self.level_map.get(level, self.log_info)
 
-        def logger(message):
+        def is_enabled():
+            if console_output:
+                return True
+            handler = self._handler
+            return handler is not None and level >= handler.level
+
+        def logger(message, *args):
             """Generated logging function with caller context."""
+            if not is_enabled():
+                return
+            if args:
+                message = message % args
             # Get father caller func name with _getframe(1)
             caller = sys._getframe(1).f_code.co_name
             log_method(caller, message)
             if console_output:
                 gcode_adapter.console_print(str(message), log=False)
 
+        logger.is_enabled = is_enabled
         return logger
 
     def create_log_info(self, console_output=False):
@@ -296,19 +296,21 @@ class PeriodicTask:
             float: The next wake time for the timer, or reactor.NEVER
             if the timer no longer exists.
         """
-        if self.func is None or self.timer is None:
+        # Bound once by schedule(), read into locals per tick
+        func = self.func
+        if func is None or self.timer is None:
             self.log_warning(f"periodic task func or timer not exists, exit")
             return self.reactor.NEVER
 
         try:
-            result = self.func(**self.params) \
-                if self.params is not None \
-                else self.func()
+            params = self.params
+            result = func(**params) if params is not None else func()
             # self.log_info(
-            #     f"periodic task executed func:{self.func} at {eventtime}")
+            #     f"periodic task executed func:{func} at {eventtime}")
 
-            if self.callback:
-                self.callback(result)
+            callback = self.callback
+            if callback:
+                callback(result)
 
         except Exception as e:
             self.log_error(f"periodic task error:{e}, exit")
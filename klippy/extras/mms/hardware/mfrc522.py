@@ -7,11 +7,55 @@
 import binascii, hashlib, json, logging, os, re, time
 from collections import OrderedDict
 from contextlib import contextmanager
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Dict, Any, Type
 
 from ...bus import MCU_SPI_from_config
 
+try:
+    # Optional, faster non-cryptographic digest for cache integrity
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    # Optional, faster drop-in of json for compact dumps/loads
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _fast_digest(data):
+    """
+    16 bytes digest for in-memory integrity check, not for security.
+    xxh3_128 if xxhash is installed, else blake2b.
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_128(data).digest()
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _build_crc_a_table():
+    """
+    Byte-wise lookup table of CRC_A (ISO/IEC 14443-3),
+    reflected polynomial 0x8408 (x^16 + x^12 + x^5 + 1).
+    """
+    table = []
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0x8408 if crc & 0x01 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC_A_TABLE = _build_crc_a_table()
+
+# 32 bytes SHA-256 as hex string
+_SHA256_HEX_RE = re.compile(r"[0-9A-Fa-f]{64}")
+# Blocks of Sector 15 the SHA-256 of block 0~59 is written into
+_HASH_BLOCK_NUMS = frozenset((60, 61))
+
 
 class BlockReadingError(Exception):
     def __init__(self, msg):
@@ -225,6 +269,22 @@ class MFRC522Config:
     # CRC
     CRC_ENABLE = 0x03
 
+    # Expected response length, in bits
+    # ATQA, answer to REQA, 2 bytes
+    ATQA_BITS = 0x10
+    # SAK with CRC_A, answer to SELECT, 3 bytes
+    SAK_BITS = 0x18
+    # MIFARE ACK/NAK, 4 bits
+    MF_ACK_BITS = 0x04
+    # MIFARE ACK value, any other value is a NAK
+    MF_ACK = 0x0A
+    # Data bytes of a MIFARE Classic block
+    BLOCK_SIZE = 16
+    # Present mask of all 64 blocks read, see read_all_blocks_into()
+    ALL_BLOCKS_MASK = (1 << 64) - 1
+    # CRC_A preset, same as ModeReg CRCPreset=01 set in MFRC522Handler
+    CRC_A_PRESET = 0x6363
+
 
 @dataclass(frozen=True)
 class MFRC522Status:
@@ -415,14 +475,25 @@ class BaseModel:
         Convert model to a dictionary representation.
         """
         return {key: value
-            for key, value in self.dct_obj.__dict__.items()
+            for key, value in vars(self.dct_obj).items()
             if value is not None}
 
     def to_json(self) -> str:
         """
-        Convert model to JSON representation.
+        Convert model to compact JSON representation.
+        Values not serializable by json fall back to str().
+        Use orjson if installed, output is the same compact form.
         """
-        return json.dumps(self.to_dict(), indent=4)
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(), default=str).decode()
+        return json.dumps(
+            self.to_dict(), separators=(",", ":"), default=str)
+
+    def to_json_pretty(self) -> str:
+        """
+        Convert model to indented JSON representation, for logging/debug.
+        """
+        return json.dumps(self.to_dict(), indent=4, default=str)
 
     def from_dict(self, data: Dict[str, Any]):
         """
@@ -436,6 +507,8 @@ class BaseModel:
         """
         Setup a model instance from JSON data.
         """
+        if orjson is not None:
+            return self.from_dict(orjson.loads(json_data))
         return self.from_dict(json.loads(json_data))
 
 
@@ -454,8 +527,8 @@ class RFIDModel(BaseModel):
             return bytes.fromhex(hex_string).decode("utf-8").rstrip("\x00")
         except Exception as e:
             logging.error(
-                f"Error decoding string with hex: {hex_string}."
-                f" Exception: {e}")
+                "Error decoding string with hex: %s. Exception: %s",
+                hex_string, e)
             return hex_string
 
     def decode_hex_to_int(self, hex_string):
@@ -464,7 +537,8 @@ class RFIDModel(BaseModel):
             return int.from_bytes(unhex, byteorder="little")
         except Exception as e:
             logging.error(
-                f"Error decoding int with hex: {hex_string}. Exception: {e}")
+                "Error decoding int with hex: %s. Exception: %s",
+                hex_string, e)
             # return -1
             return hex_string
 
@@ -493,9 +567,14 @@ class RFIDModel(BaseModel):
         Create a new instance from blocks of data.
         """
         data = {}
+        # Block hex string without separators, stripped once per block
+        stripped = {}
 
         for field, (block_num, offset, length) in RFIDDict.get_field_items():
-            block_value = blocks.get(str(block_num), "").replace(" ", "")
+            block_value = stripped.get(block_num)
+            if block_value is None:
+                block_value = blocks.get(str(block_num), "").replace(" ", "")
+                stripped[block_num] = block_value
 
             if len(block_value) < offset + length:
                 raise ValueError(
@@ -520,7 +599,7 @@ class RFIDModel(BaseModel):
             return binascii.hexlify(utf8_string).decode("utf-8").upper()
         except Exception as e:
             logging.error(
-                f"Error encoding string to hex: {string}. Exception: {e}")
+                "Error encoding string to hex: %s. Exception: %s", string, e)
             return string
 
     def encode_int_to_hex(self, integer):
@@ -531,7 +610,7 @@ class RFIDModel(BaseModel):
             return hex_string
         except Exception as e:
             logging.error(
-                f"Error encoding int to hex: {integer}. Exception: {e}")
+                "Error encoding int to hex: %s. Exception: %s", integer, e)
             return integer
 
     def encode_field(self, field_name, value):
@@ -639,28 +718,119 @@ class RFIDCache:
 
     No expired time set.
     If need to build a LRU cache, use deque
+
+    With verify=True, a val holding a mutable buffer (bytearray,
+    e.g. the raw blocks) is stored with a digest of that buffer,
+    if the buffer is changed or corrupted after add(), get() drops
+    it and treats it as a miss. Immutable vals can not change after
+    add() and are stored without digest.
+
+    With protected_size > 0, the cache is a segmented LRU (SLRU):
+    new vals enter the probation segment, a hit promotes it to the
+    protected segment of at most protected_size entries. Eviction
+    takes the oldest probation val first, so Tags read again and
+    again are not flushed by a run of new Tags.
     """
-    def __init__(self, max_size=16):
+    def __init__(self, max_size=16, verify=False, protected_size=0):
+        # Probation segment, the only segment if protected_size is 0
         self._cache = OrderedDict()
+        self._protected = OrderedDict()
         self.max_size = max_size
+        self.verify = verify
+        self.protected_size = min(protected_size, max_size - 1)
 
-    def get(self, key):
-        if key in self._cache:
-            # Move to the end to indicate recent use
-            val = self._cache.pop(key)
-            self._cache[key] = val
-            return val
+    @staticmethod
+    def _digest(val):
+        """
+        Digest of the raw buffer in val, None if val has no mutable
+        buffer to check.
+        """
+        if isinstance(val, bytearray):
+            return _fast_digest(val)
+        if isinstance(val, tuple):
+            for item in val:
+                if isinstance(item, bytearray):
+                    return _fast_digest(item)
         return None
 
+    def _touch(self, key):
+        """
+        Mark key as recently used, return the stored entry.
+        Caller must check key is cached.
+        """
+        protected = self._protected
+        if key in protected:
+            # Move to the end to indicate recent use
+            entry = protected.pop(key)
+            protected[key] = entry
+            return entry
+
+        entry = self._cache.pop(key)
+        if self.protected_size <= 0:
+            self._cache[key] = entry
+            return entry
+
+        # Hit in probation, promote to protected
+        protected[key] = entry
+        if len(protected) > self.protected_size:
+            # Demote the oldest protected back to probation
+            old_key, old_entry = protected.popitem(last=False)
+            self._cache[old_key] = old_entry
+        return entry
+
+    def get(self, key):
+        if key not in self._cache and key not in self._protected:
+            return None
+
+        entry = self._touch(key)
+        if not self.verify:
+            return entry
+
+        val, digest = entry
+        if self._digest(val) != digest:
+            # Integrity check failed, drop it
+            self.remove(key)
+            return None
+        return val
+
     def add(self, key, val):
-        if key in self._cache:
+        if key in self._cache or key in self._protected:
             # Remove old val with same key
-            self._cache.pop(key)
-        elif len(self._cache) >= self.max_size:
-            # Check size, if out of size, remove oldest val
-            self._cache.popitem(last=False)
+            self.remove(key)
+        elif len(self._cache) + len(self._protected) >= self.max_size:
+            # Check size, if out of size, remove oldest val,
+            # probation first
+            if self._cache:
+                self._cache.popitem(last=False)
+            else:
+                self._protected.popitem(last=False)
+
+        self._cache[key] = (val, self._digest(val)) if self.verify else val
 
-        self._cache[key] = val
+    def remove(self, key):
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            entry = self._protected.pop(key, None)
+        return entry
+
+    def add_timed(self, key, val):
+        """
+        Add val with current monotonic time, for get_fresh().
+        """
+        self.add(key, (time.monotonic(), val))
+
+    def get_fresh(self, key, ttl):
+        """
+        Get val added by add_timed() no older than ttl seconds.
+        """
+        entry = self.get(key)
+        if entry is None:
+            return None
+
+        added_at, val = entry
+        if time.monotonic() - added_at > ttl:
+            return None
+        return val
 
     def get_cache(self):
         return self._cache
@@ -677,30 +847,41 @@ class HashAssistant:
         Defaults to SHA-256.
         """
         self.algorithm = algorithm
+        # Reusable scratch for block 0~59, 16 bytes each
+        self._scratch = bytearray(16 * 60)
+        self._scratch_view = memoryview(self._scratch)
 
-    def _hash_data(self, string):
+    def _hash_data(self, data):
         """
-        Compute the hash of the given hexadecimal string.
+        Compute the hash of the given hexadecimal string or bytes.
+        Hash the whole data in one call, so hashlib (OpenSSL) can run
+        the SHA extensions of CPU over a contiguous buffer.
         """
-        hasher = self.algorithm()
-        hasher.update(bytes.fromhex(string))
+        if isinstance(data, str):
+            data = bytes.fromhex(data)
         # 32 bytes binary int data
-        return hasher.digest()
+        return self.algorithm(data).digest()
 
-    def hash_as_list(self, string):
+    def hash_as_list(self, data):
         """
-        Get the hash of the given hexadecimal string
+        Get the hash of the given hexadecimal string or bytes
         as a list of integers.
         """
-        hash_data = self._hash_data(string)
+        hash_data = self._hash_data(data)
         return list(hash_data)
 
-    def hash_as_string(self, string):
+    def hash_as_bytes(self, data):
         """
-        Get the hash of the given hexadecimal string
+        Get the hash of the given hexadecimal string or bytes as bytes.
+        """
+        return self._hash_data(data)
+
+    def hash_as_string(self, data):
+        """
+        Get the hash of the given hexadecimal string or bytes
         as an uppercase hex string.
         """
-        hash_data = self._hash_data(string)
+        hash_data = self._hash_data(data)
         return hash_data.hex().upper()
 
     def block_to_string(self, block_data_lst):
@@ -721,6 +902,38 @@ class HashAssistant:
         # Concatenate all block data strings without spaces
         return ''.join(map(lambda tup:tup[1].replace(" ", ""), block_data_lst))
 
+    def block_to_bytes(self, block_data_lst):
+        """
+        Convert a list of block data to continuous bytes.
+        Same input as block_to_string().
+
+        [(block_num, block_data), ..]
+        block_data => "23 C0 20 F7 34 08 04 ..."
+        transform to => b"\x23\xC0\x20\xF7\x34\x08\x04..."
+        """
+        # Sort by block_num ascend
+        block_data_lst.sort(key=lambda tup:tup[0])
+
+        # bytes.fromhex() skips the spaces itself
+        return b"".join(bytes.fromhex(tup[1]) for tup in block_data_lst)
+
+    def hash_blocks_as_string(self, block_data_lst):
+        """
+        Get the hash of block data list as an uppercase hex string,
+        the blocks are packed into the reusable scratch buffer first.
+
+        - block_data_lst: Sorted list of at most 60 tuples
+          (block_num, block_data), same as block_to_string().
+        """
+        view = self._scratch_view
+        size = 0
+        for _, block_data in block_data_lst:
+            data = bytes.fromhex(block_data)
+            view[size:size + len(data)] = data
+            size += len(data)
+
+        return self._hash_data(view[:size]).hex().upper()
+
     def is_valid_length(self, hash_string):
         """
         Check if the length of the given hash string is valid for SHA-256.
@@ -751,6 +964,23 @@ class HashAssistant:
 
         return zero_ratio >= threshold
 
+    def check_hash(self, hash_string, threshold=0.6):
+        """
+        Run the checks of is_valid_length(), is_hexadecimal() and
+        has_high_zero_ratio() in one call.
+        Return None if valid, else the reason string.
+        """
+        # Length and hex checked in one compiled pass
+        if _SHA256_HEX_RE.fullmatch(hash_string) is None:
+            if len(hash_string) != 64:
+                return "has wrong length"
+            return "is not hex"
+
+        if hash_string.count("0") >= threshold * 64:
+            return "has high zero ratio"
+
+        return None
+
 
 class MFRC522Handler:
     """
@@ -762,22 +992,58 @@ class MFRC522Handler:
     • Serial UART
     • I2C-bus interface
     """
-    def __init__(self, spi):
+    def __init__(self, spi, reactor=None):
         self.spi = spi
-        self.auth_key = [0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF]
+        # Klippy reactor, used to pause between retries without
+        # blocking the event loop. Fall back to time.sleep() if None.
+        self.reactor = reactor
+        # Default key A, frozen as bytes once
+        self.auth_key = bytes((0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF))
+        # Reusable AUTH frame: auth_mode, block_num, 6 bytes key, 4 bytes UID
+        # Assign through memoryview so the size can never change
+        self._auth_buf = bytearray(12)
+        self._auth_view = memoryview(self._auth_buf)
 
         self.retry_times = 10
-        self.timeout_crc = 0.5 # seconds
+        # Fixed short delay between retries, in seconds,
+        # a miss costs at most (retry_times - 1) * retry_delay
+        self.retry_delay = 0.005
+        # Max tags found in detect_multiple_tags()
+        self.max_tags = 16
         self.timeout_cmd_exec = 0.5 # seconds
+        # IRQ waiting: busy-poll first, then sleep between polls
+        self.spin_polls = 32
+        # Sleep between polls for AUTHENT and long transceive frames
+        self.poll_interval = 0.001 # seconds
+        # Transceive frames up to this length (REQA, anticollision, READ)
+        # complete in tens of us, only yield the CPU between polls,
+        # time.sleep() may overshoot to the scheduler granularity
+        self.short_frame_len = 4
+        # Calculate CRC_A with the MFRC522 coprocessor instead of
+        # the software lookup table, for debugging only
+        self.use_hw_crc = False
 
         # Use register address "REG*" as string
         # -> getattr(self.reg, "REG*")
         self.reg = MFRC522Register()
+        # Resolve SPI address bytes of all registers once
+        # -> self._reg_addr["REG*"]
+        self._reg_addr = {
+            f.name: getattr(self.reg, f.name) << 1
+            for f in fields(self.reg)
+        }
 
         # Use config data as attribute
         # -> self.config.MODE_HIGH
         self.config = MFRC522Config()
 
+        # TX frames to drain 0~64 bytes of FIFO in one transfer,
+        # "count" address bytes and the trailing dummy byte,
+        # built once and shared by all reads
+        fifo_read_addr = self.config.MOD_HIGH | self._reg_addr["REG_FIFO_DATA"]
+        self._fifo_read_tx = tuple(
+            [fifo_read_addr] * count + [0x00] for count in range(65))
+
         # Use status as attribute
         # -> self.status.OK
         self.status = MFRC522Status()
@@ -829,19 +1095,33 @@ class MFRC522Handler:
         # Turn on the antenna
         # self.pcd_antenna_on()
 
+        # CRC of READ/WRITE commands only depend on block_num,
+        # precompute them for all 64 blocks
+        self._read_crcs = self._build_block_crcs(self.config.PICC_CMD_READ)
+        self._write_crcs = self._build_block_crcs(self.config.PICC_CMD_WRITE)
+
+    def _build_block_crcs(self, picc_cmd):
+        """
+        Build CRC_A [CRC_L, CRC_H] of [picc_cmd, block_num]
+        for block 0~63.
+        """
+        return tuple(
+            self.pcd_calculate_CRC([picc_cmd, block_num])[:2]
+            for block_num in range(64)
+        )
+
     # Basic
     def get_reg_addr(self, reg_name):
-        reg_addr = getattr(self.reg, reg_name)
         # When using SPI with MFRC522, all addresses are shifted
         # one bit left in the "SPI address byte".
-        reg_addr = reg_addr << 1
-
-        return reg_addr
+        # Shifted addresses are cached in __init__()
+        return self._reg_addr[reg_name]
 
     def get_config_value(self, val):
         # If value is a string, get the 16bit int from MFRC522Config()
-        val_data = val if type(val) == int else getattr(self.config, val)
-        return val_data
+        if isinstance(val, int):
+            return val
+        return getattr(self.config, val)
 
     def write_reg(self, reg_name, val):
         """
@@ -864,10 +1144,14 @@ class MFRC522Handler:
         reg_addr = self.get_reg_addr(reg_name)
         send_lst = [reg_addr, ]
 
-        for val in val_lst:
-            # If value is a string, get the 16bit int from MFRC522Config()
-            val_data = self.get_config_value(val)
-            send_lst.append(val_data)
+        if isinstance(val_lst, (bytes, bytearray, memoryview)):
+            # Bytes-like data are ints already
+            send_lst.extend(val_lst)
+        else:
+            for val in val_lst:
+                # If value is a string, get the 16bit int from MFRC522Config()
+                val_data = self.get_config_value(val)
+                send_lst.append(val_data)
 
         # In klippy, spi.spi_send() is similar to "spi_transfer",
         # but it does not generate a "spi_transfer_response" message.
@@ -912,6 +1196,61 @@ class MFRC522Handler:
         res = bytearray(ret["response"])[1:]
         return res
 
+    def _wait_irq(self, reg_name, irq_mask, timeout, poll_interval):
+        """
+        Poll the IRQ register until any bit in "irq_mask" is set.
+        Most commands complete within a few polls, so busy-poll
+        "spin_polls" times first, then sleep "poll_interval" between polls.
+        If "poll_interval" is 0, yield the CPU instead of sleeping.
+        Return the register value, or None if timeout.
+        """
+        for _ in range(self.spin_polls):
+            val = self.read_reg(reg_name)
+            if val & irq_mask:
+                return val
+
+        # Integer compare against a deadline sampled once
+        deadline_ns = time.monotonic_ns() + int(timeout * 1e9)
+        while time.monotonic_ns() < deadline_ns:
+            if poll_interval > 0:
+                time.sleep(poll_interval)
+            else:
+                os.sched_yield()
+            val = self.read_reg(reg_name)
+            if val & irq_mask:
+                return val
+
+        return None
+
+    def multi_read_reg(self, reg_names):
+        """
+        Read values from several registers of MFRC522 in one SPI transfer.
+        Return a list of values in the same order as "reg_names".
+        """
+        if not reg_names:
+            return []
+
+        # Each response byte is the value of the previous address byte,
+        # a trailing 0x00 clocks out the last one.
+        reg_lst = [self.config.MOD_HIGH | self.get_reg_addr(reg_name)
+                   for reg_name in reg_names]
+        reg_lst.append(0x00)
+
+        ret = self.spi.spi_transfer(reg_lst)
+        return list(bytearray(ret["response"])[1:])
+
+    def read_fifo_burst(self, count):
+        """
+        Read "count" bytes from FIFO in one SPI transfer,
+        with the preallocated TX template.
+        """
+        if count <= 0:
+            return bytearray()
+
+        ret = self.spi.spi_transfer(self._fifo_read_tx[min(count, 64)])
+        # The response may be a list of ints, skip the first byte
+        return bytearray(ret["response"])[1:]
+
     # PCD Related
     def pcd_reset(self):
         """
@@ -982,13 +1321,32 @@ class MFRC522Handler:
         return self.read_reg("REG_VERSION")
 
     def pcd_calculate_CRC(self, buffer):
+        """
+        Calculates the CRC_A value for the given input data.
+        "buffer" should be an int list like [0x00, 0x01, ...]
+        Return [CRC_L, CRC_H], the same order as it is sent.
+
+        Computed in software, which saves the SPI round-trips to the
+        MFRC522 CRC coprocessor. Set "use_hw_crc" to use the chip.
+        """
+        if self.use_hw_crc:
+            return self.pcd_calculate_CRC_hw(buffer)
+
+        crc = self.config.CRC_A_PRESET
+        for b in buffer:
+            crc = (crc >> 8) ^ _CRC_A_TABLE[(crc ^ b) & 0xFF]
+        return [crc & 0xFF, (crc >> 8) & 0xFF]
+
+    def pcd_calculate_CRC_hw(self, buffer):
         """
         Calculates the CRC value for the given input data using the MFRC522
         chip. "buffer" should be an int list like [0x00, 0x01, ...]
         """
-        # Clear the CRC IRQ flag and set the FIFO level to maximum.
-        self.pcd_clear_bit_mask("REG_DIV_IRQ", 0x04)
-        self.pcd_set_bit_mask("REG_FIFO_LEVEL", self.config.MOD_HIGH)
+        # Clear the CRC IRQ flag and flush the FIFO buffer.
+        # DivIrqReg Set2=0: writing 1 to a bit clears it, no RMW needed.
+        self.write_reg("REG_DIV_IRQ", 0x04)
+        # FIFOLevelReg FlushBuffer=1
+        self.write_reg("REG_FIFO_LEVEL", self.config.MOD_HIGH)
 
         # Write the input data to the FIFO.
         self.bulk_write_reg("REG_FIFO_DATA", buffer)
@@ -996,20 +1354,18 @@ class MFRC522Handler:
         # Start the CRC calculation command.
         self.write_reg("REG_COMMAND", self.config.PCD_CALC_CRC)
 
-        # Wait for the CRC calculation to complete.
-        start_time = time.time()
-        while 1:
-            val = self.read_reg("REG_DIV_IRQ")
-            if (val & 0x04):
-                # CRCIRq bit set - calculation done
-
-                # Stop calculating CRC for new content in the FIFO.
-                # self.write_reg("REG_COMMAND", self.config.PCD_IDLE)
-                break
-
-            if time.time() - start_time > self.timeout_crc:
-                # Time out
+        # Wait for the CRC calculation to complete,
+        # CRCIRq bit set - calculation done.
+        # The coprocessor takes a few us per byte, which is far less
+        # than one SPI read, so bound the polling by the buffer size.
+        # Keep reading the result even if time out.
+        for _ in range(len(buffer) * 4 + 8):
+            if self.read_reg("REG_DIV_IRQ") & 0x04:
                 break
+        else:
+            logging.error("CRC/Reading REG_DIV_IRQ timeout")
+        # Stop calculating CRC for new content in the FIFO.
+        # self.write_reg("REG_COMMAND", self.config.PCD_IDLE)
 
         # Read the calculated CRC value from the chip.
         return [self.read_reg("REG_CRC_RESULT_L"),
@@ -1032,14 +1388,17 @@ class MFRC522Handler:
         """
         assert uid, f"AUTH get error UID: {uid}"
 
+        buffer = self._auth_buf
+        view = self._auth_view
         # First byte should be the auth_mode
         # Second byte is the block_num
-        buffer = [auth_mode, block_num]
-
-        # Append the authKey which default is 6 bytes of 0xFF
-        buffer += auth_key
-        # Next append the first 4 bytes of the UID
-        buffer += uid[:4]
+        view[0] = auth_mode
+        view[1] = block_num
+        # Then the authKey which default is 6 bytes of 0xFF
+        # bytes() returns "auth_key" itself if it is bytes already
+        view[2:8] = bytes(auth_key)
+        # Next the first 4 bytes of the UID
+        view[8:12] = bytes(uid[:4])
 
         try:
             # Start the authentication
@@ -1047,12 +1406,12 @@ class MFRC522Handler:
                 command=self.config.PCD_AUTHENT, send_data=buffer)
 
         except Exception as e:
-            logging.error(f"AUTH error: {e}")
+            logging.error("AUTH error: %s", e)
             return self.status.ERROR
 
         # Check if an error occurred
         if status != self.status.OK:
-            logging.error(f"AUTH error, status: {status}")
+            logging.error("AUTH error, status: %s", status)
 
         # if not (self.read_reg("REG_STATUS_2") & 0x08) != 0:
         #     logging.info("AUTH ERROR(status2reg & 0x08) != 0")
@@ -1090,54 +1449,62 @@ class MFRC522Handler:
         buffer += uid[:5]
 
         try:
-            # Calculate the CRC values for the buffer
-            buffer_crc = self.pcd_calculate_CRC(buffer)
-            buffer += buffer_crc[:2]
-
-            # Send the buffer to the tag and receive the response
-            status, back_data, back_bits = self.pcd_to_picc(
-                command=self.config.PCD_TRANSCEIVE,
-                send_data=buffer, need_bits_len=True)
+            # Send the buffer with CRC to the tag and receive the response
+            status, back_data, back_bits = self.pcd_transceive_crc(
+                buffer, need_bits_len=True)
 
         except Exception as e:
-            logging.error(f"Select error: {e}")
+            logging.error("Select error: %s", e)
             return self.status.ERROR
 
         # Check if the response is successful
-        # and has the expected length 0x18 == 24
+        # and has the expected length of SAK, 0x18 == 24
         # Return error if the response is not successful
         # or has an unexpected length
-        if (status != self.status.OK) or (back_bits != 0x18):
-            return self.status.ERROR
-
         # Return the first byte of the response, which is the size
         # return back_data[0]
-        return self.status.OK
+        is_ok = (status == self.status.OK
+                 and back_bits == self.config.SAK_BITS)
+        return self.status.OK if is_ok else self.status.ERROR
 
     # Communicate between PCD and PICC
-    def pcd_to_picc(self, command, send_data, need_bits_len=False):
+    def pcd_to_picc(self, command, send_data, need_bits_len=False,
+                    expect_ack_only=False):
         """
         Transfers data to the MFRC522 FIFO,
         executes a command,
         waits for completion
         and transfers data back from the FIFO.
+
+        expect_ack_only
+            Only a 4 bits ACK/NAK is expected for transceive,
+            read 1 byte from FIFO whatever the FIFO level is.
         """
+        # Bind constants used more than once to locals
+        config = self.config
+        mod_high = config.MOD_HIGH
+        is_auth = command == config.PCD_AUTHENT
+        is_transceive = command == config.PCD_TRANSCEIVE
+
         # Set interrupt request and wait flags based on command
-        if command == self.config.PCD_AUTHENT:
-            irq_wait = self.config.IRQ_WAIT_AUTH
-            irq_enable = self.config.IRQ_EN_AUTH
+        if is_auth:
+            irq_wait = config.IRQ_WAIT_AUTH
+            irq_enable = config.IRQ_EN_AUTH
         else:
-            # Default for self.config.PCD_TRANSCEIVE
-            irq_wait = self.config.IRQ_WAIT
-            irq_enable = self.config.IRQ_EN
+            # Default for config.PCD_TRANSCEIVE
+            irq_wait = config.IRQ_WAIT
+            irq_enable = config.IRQ_EN
 
         # Enable interrupts and reset FIFO buffer
-        self.write_reg("REG_COM_IEN", irq_enable | self.config.MOD_HIGH)
-        self.pcd_clear_bit_mask("REG_COM_IRQ", self.config.MOD_HIGH)
-        self.pcd_set_bit_mask("REG_FIFO_LEVEL", self.config.MOD_HIGH)
+        # The target values are fully known, write directly without RMW
+        self.write_reg("REG_COM_IEN", irq_enable | mod_high)
+        # ComIrqReg Set1=0: clear all interrupt request bits
+        self.write_reg("REG_COM_IRQ", config.MOD_LOW)
+        # FIFOLevelReg FlushBuffer=1
+        self.write_reg("REG_FIFO_LEVEL", mod_high)
 
         # Put MFRC522 into idle state
-        self.write_reg("REG_COMMAND", self.config.PCD_IDLE)
+        self.write_reg("REG_COMMAND", config.PCD_IDLE)
 
         # Write data to FIFO buffer
         self.bulk_write_reg("REG_FIFO_DATA", send_data)
@@ -1150,8 +1517,8 @@ class MFRC522Handler:
         self.write_reg("REG_COMMAND", command)
 
         # Set bit framing if command is transceive
-        if command == self.config.PCD_TRANSCEIVE:
-            self.pcd_set_bit_mask("REG_BIT_FRAMING", self.config.MOD_HIGH)
+        if is_transceive:
+            self.pcd_set_bit_mask("REG_BIT_FRAMING", mod_high)
 
         # Wait for command execution
         # start_time = time.time()
@@ -1167,28 +1534,38 @@ class MFRC522Handler:
         #         # status = self.status.TIMEOUT
         #         # Return? Raise TimeoutException?
         #         break
-        start_time = time.time()
-        timeout = (self.timeout_cmd_exec
-                   * (2 if command == self.config.PCD_AUTHENT else 1))
-        while time.time() - start_time < timeout:
-            val = self.read_reg("REG_COM_IRQ")
-            if val & (0x01 | irq_wait):
-                break
-            time.sleep(0.005)
+        timeout = self.timeout_cmd_exec * (2 if is_auth else 1)
+        if is_transceive and len(send_data) <= self.short_frame_len:
+            poll_interval = 0
         else:
+            poll_interval = self.poll_interval
+
+        val = self._wait_irq("REG_COM_IRQ", 0x01 | irq_wait,
+                             timeout, poll_interval)
+        if val is None:
             # Time out
             logging.error("Command/Reading REG_COM_IRQ timeout")
             return self.status.TIMEOUT, [], 0
 
+        # Read the status registers in a single SPI transfer,
+        # FIFO level and last bits are only used by transceive
+        reg_lst = ["REG_BIT_FRAMING", "REG_ERROR"]
+        if is_transceive:
+            reg_lst.append("REG_FIFO_LEVEL")
+            if need_bits_len:
+                reg_lst.append("REG_CONTROL")
+        val_lst = self.multi_read_reg(reg_lst)
+        val_bit_framing, val_err = val_lst[0], val_lst[1]
+
         # Clear bit framing if command is transceive
-        self.pcd_clear_bit_mask("REG_BIT_FRAMING", self.config.MOD_HIGH)
+        self.write_reg("REG_BIT_FRAMING",
+                       val_bit_framing & (~mod_high))
 
         status = self.status.ERROR
         back_data = []
         back_bits = 0
 
         # Check for errors and update status accordingly
-        val_err = self.read_reg("REG_ERROR")
         if (val_err & 0x1B) == 0x00:
             if val & irq_enable & 0x01:
                 status = self.status.NO_TAG
@@ -1196,17 +1573,18 @@ class MFRC522Handler:
                 status = self.status.OK
 
             # Read response data if command is transceive
-            if command == self.config.PCD_TRANSCEIVE:
-                lvl = self.read_reg("REG_FIFO_LEVEL") or 1
+            if is_transceive:
+                lvl = val_lst[2] or 1
 
                 # Read only the first 16 bytes of FIFO data
                 # Some unknown bytes may come after 16+
                 max_len = 16
                 lvl = min(lvl, max_len)
 
-                back_data += self.bulk_read_reg("REG_FIFO_DATA", lvl)
+                read_len = 1 if expect_ack_only else lvl
+                back_data += self.read_fifo_burst(read_len)
                 if need_bits_len:
-                    last_bits = self.read_reg("REG_CONTROL") & 0x07
+                    last_bits = val_lst[3] & 0x07
 
                     if last_bits != 0:
                         back_bits = (lvl - 1) * 8 + last_bits
@@ -1215,6 +1593,20 @@ class MFRC522Handler:
 
         return status, back_data, back_bits
 
+    def pcd_transceive_crc(self, buffer, need_bits_len=False,
+                           buffer_crc=None, expect_ack_only=False):
+        """
+        Transceive "buffer" followed by its CRC_A.
+        "buffer_crc" is the precomputed CRC_A, calculated if None.
+        """
+        if buffer_crc is None:
+            buffer_crc = self.pcd_calculate_CRC(buffer)
+        return self.pcd_to_picc(
+            command=self.config.PCD_TRANSCEIVE,
+            send_data=list(buffer) + list(buffer_crc[:2]),
+            need_bits_len=need_bits_len,
+            expect_ack_only=expect_ack_only)
+
     def request(self, mode):
         """
         Transmits a request command to a tag or card to initiate communication.
@@ -1235,13 +1627,13 @@ class MFRC522Handler:
                 send_data=buffer, need_bits_len=True)
 
         except Exception as e:
-            logging.error(f"Request error: {e}")
+            logging.error("Request error: %s", e)
             return self.status.ERROR
 
         # If the status is not OK
-        # or the back bits are not 0x10 == 16,
+        # or the back bits are not ATQA, 0x10 == 16,
         # set status to ERROR
-        if (status != self.status.OK) or (back_bits != 0x10):
+        if (status != self.status.OK) or (back_bits != self.config.ATQA_BITS):
             status = self.status.ERROR
 
         return status
@@ -1263,7 +1655,7 @@ class MFRC522Handler:
                 command=self.config.PCD_TRANSCEIVE, send_data=buffer)
             # logging.info(f"status={status}, back_data={back_data}")
         except Exception as e:
-            logging.error(f"Anti-collision error: {e}")
+            logging.error("Anti-collision error: %s", e)
             status = self.status.ERROR
             back_data = []
 
@@ -1275,13 +1667,13 @@ class MFRC522Handler:
             if len(back_data) == 5:
                 # Calculate the XOR checksum of the first 4 bytes
                 # of the back_data
-                check = 0
-                for i in range(4):
-                    check = check ^ back_data[i]
+                check = (back_data[0] ^ back_data[1]
+                         ^ back_data[2] ^ back_data[3])
 
                 # Check if the calculated checksum matches the 5th
                 # byte of back_data
-                if check != back_data[4]:
+                bcc = back_data[4]
+                if check != bcc:
                     # If not, set the status to ERROR
                     status = self.status.ERROR
             else:
@@ -1296,21 +1688,26 @@ class MFRC522Handler:
         self.write_reg("REG_BIT_FRAMING", 0x00)
         # self.pcd_to_picc(self.config.PCD_TRANSCEIVE, buffer)
 
-        buffer_crc = self.pcd_calculate_CRC(buffer)
-        # self.pcd_to_picc(self.config.PCD_TRANSCEIVE, buffer + crc)
-        self.pcd_to_picc(self.config.PCD_TRANSCEIVE, buffer + buffer_crc[:2])
+        self.pcd_transceive_crc(buffer)
 
     def detect_multiple_tags(self):
         uids = []
-        while True:
+        seen = set()
+        # Bounded, don't rely on picc_halt() to stop the loop
+        for _ in range(self.max_tags):
             status, uid = self.anticollision()
-            logging.info(f"status={status}, uid={uid}")
+            logging.info("status=%s, uid=%s", status, uid)
 
             if status != self.status.OK:
                 break
-            if not any(u == uid for u in uids):
-                uids.append(uid)
-                self.picc_halt()
+
+            key = tuple(uid)
+            if key in seen:
+                # Same tag found again, no more new tags
+                break
+            seen.add(key)
+            uids.append(uid)
+            self.picc_halt()
 
         return uids
 
@@ -1325,16 +1722,10 @@ class MFRC522Handler:
 
         buffer = [self.config.PICC_CMD_READ, block_num]
         try:
-            # Calculate the CRC checksum for the command and block address
-            buffer_crc = self.pcd_calculate_CRC(buffer)
-            # Append the calculated checksum to the command and
-            # block address array
-            buffer += buffer_crc[:2]
-
-            # Send the command and block address array to the RFID card
-            # and receive response
-            status, back_data, _ = self.pcd_to_picc(
-                command=self.config.PCD_TRANSCEIVE, send_data=buffer)
+            # Send the command and block address array with
+            # precomputed CRC to the RFID card and receive response
+            status, back_data, _ = self.pcd_transceive_crc(
+                buffer, buffer_crc=self._read_crcs[block_num])
 
         except Exception as e:
             err_msg = f"read block error: {e}"
@@ -1343,7 +1734,7 @@ class MFRC522Handler:
 
         if status != self.status.OK:
             err_msg = f"Error reading block: {block_num}, status: {status}"
-        elif len(back_data) != 16:
+        elif len(back_data) != self.config.BLOCK_SIZE:
             err_msg = (f"Error reading block: {block_num}"
                        f", length: {len(back_data)}")
 
@@ -1354,6 +1745,14 @@ class MFRC522Handler:
         # If response data has length 16, return data
         return back_data
 
+    def _is_mf_ack(self, status, back_data, back_bits):
+        """
+        Check the 4 bits MIFARE ACK answered to WRITE.
+        """
+        return (status == self.status.OK
+                and back_bits == self.config.MF_ACK_BITS
+                and (back_data[0] & 0x0F) == self.config.MF_ACK)
+
     def write_block(self, block_num, data):
         """
         Write data to a specified block address in the RFID tag.
@@ -1366,52 +1765,43 @@ class MFRC522Handler:
         buffer = [self.config.PICC_CMD_WRITE, block_num]
 
         try:
-            # Calculate the CRC checksum for the command and block address
-            # Append the calculated checksum
-            buffer += self.pcd_calculate_CRC(buffer)[:2]
-
-            # Send the buffer to the tag and receive the response
-            status, back_data, back_bits = self.pcd_to_picc(
-                command=self.config.PCD_TRANSCEIVE,
-                send_data=buffer, need_bits_len=True)
+            # Send the buffer with precomputed CRC to the tag
+            # and receive the response
+            status, back_data, back_bits = self.pcd_transceive_crc(
+                buffer, need_bits_len=True,
+                buffer_crc=self._write_crcs[block_num],
+                expect_ack_only=True)
 
         except Exception as e:
-            logging.error(f"write block step 1 error: {e}")
+            logging.error("write block step 1 error: %s", e)
             return False
 
         # Check if the write operation was successful or not
-        if (status != self.status.OK or back_bits != 4
-            or (back_data[0] & 0x0F) != 0x0A):
-            logging.error(f"Write block failed, status: {status}")
+        if not self._is_mf_ack(status, back_data, back_bits):
+            logging.error("Write block failed, status: %s", status)
             return False
 
         # Begin writing
         # If the initial write operation was successful,
         # write the actual data to the tag
-        buffer_w = data[:16]
+        buffer_w = data[:self.config.BLOCK_SIZE]
 
         try:
-            # Calculate the CRC checksum for the data to be written
-            # Append the calculated checksum
-            buffer_w += self.pcd_calculate_CRC(buffer_w)[:2]
-
-            # Send the buffer to the tag and receive the response
-            status, back_data, back_bits = self.pcd_to_picc(
-                command=self.config.PCD_TRANSCEIVE,
-                send_data=buffer_w, need_bits_len=True)
+            # Send the buffer with CRC to the tag and receive the response
+            status, back_data, back_bits = self.pcd_transceive_crc(
+                buffer_w, need_bits_len=True, expect_ack_only=True)
 
         except Exception as e:
-            logging.error(f"write block step 2 error: {e}")
+            logging.error("write block step 2 error: %s", e)
             return False
 
         # Check if the write operation was successful or not
-        if (status != self.status.OK or back_bits != 4
-            or (back_data[0] & 0x0F) != 0x0A):
-            logging.error(f"Error while writing, status: {status}")
+        if not self._is_mf_ack(status, back_data, back_bits):
+            logging.error("Error while writing, status: %s", status)
             return False
 
         if status == self.status.OK:
-            logging.info(f"Data written to block: {block_num}")
+            logging.info("Data written to block: %s", block_num)
 
         return True
 
@@ -1424,7 +1814,7 @@ class MFRC522Handler:
         # assert block_data, f"Unavailable block_data: {block_data}"
         if block_data is not None:
             # block_data is a 16 bytes list
-            s = ' '.join(hex(i).upper()[2:].zfill(2) for i in block_data)
+            s = bytes(block_data).hex(" ").upper()
         else:
             # logging.warning(f"Unavailable block_data: {block_data}")
             # logging.warning("block_data is None")
@@ -1565,7 +1955,7 @@ class MFRC522Handler:
                     block_data_s = self.format_block_data(block_data)
 
             except Exception as e:
-                logging.error(f"read_single_block Error: {e}")
+                logging.error("read_single_block Error: %s", e)
 
         # Stop cryptographic communication with the tag
         self.pcd_stop_crypto_1()
@@ -1573,9 +1963,13 @@ class MFRC522Handler:
         # Return the tag ID and the read data
         return block_data_s
 
-    def read_sector(self, uid, sector_num):
+    def read_sector(self, uid, sector_num, block_nums=None):
         """
         Read data from the RFID tag sector.
+
+        - block_nums: Optional blocks of the sector to read,
+          e.g. (60, 61) of Sector 15, default all 4 blocks.
+          All of them are read with one authentication.
         """
         assert uid, f"Read sector get error UID: {uid}"
 
@@ -1585,6 +1979,10 @@ class MFRC522Handler:
 
         block_data_lst = []
         block_num_lst = range(sector_num*4, sector_num*4+4)
+        if block_nums is not None:
+            assert all(n in block_num_lst for n in block_nums), (
+                f"blocks {block_nums} are not in sector {sector_num}")
+            block_num_lst = block_nums
 
         # Authenticate with the tag using the provided key
         self.pcd_authenticate(auth_mode=self.config.PICC_CMD_AUTH_KEY_A,
@@ -1643,6 +2041,47 @@ class MFRC522Handler:
 
         return block_data_lst
 
+    def read_all_blocks_into(self, uid, buf):
+        """
+        Read all blocks data from the RFID tag into buf,
+        block n is stored at buf[n*16:(n+1)*16].
+        Return present mask, bit n is set if block n is read,
+        ALL_BLOCKS_MASK if all 64 blocks are read.
+        """
+        assert uid, f"Read all blocks get error UID: {uid}"
+
+        block_size = self.config.BLOCK_SIZE
+        view = memoryview(buf)
+        present_mask = 0
+
+        for block_num in range(64):
+            if block_num % 4 == 0:
+                # Authenticate with the tag using the provided key
+                self.pcd_authenticate(
+                    auth_mode=self.config.PICC_CMD_AUTH_KEY_A,
+                    block_num=block_num, auth_key=self.auth_key, uid=uid)
+
+            try:
+                # Read data blocks specified by block_addr
+                block_data = self.read_block(block_num)
+            except Exception as e:
+                # logging.error(f"Error: {e}")
+                break
+
+            if len(block_data) != block_size:
+                break
+
+            # read_block() returns a list of ints, memoryview
+            # slice assignment needs a bytes-like object
+            offset = block_num * block_size
+            view[offset:offset + block_size] = bytes(block_data)
+            present_mask |= 1 << block_num
+
+        # Stop cryptographic communication with the tag
+        self.pcd_stop_crypto_1()
+
+        return present_mask
+
     def write_single_block(self, uid, block_num, data):
         """
         Writes 16 bytes to the active PICC.
@@ -1666,26 +2105,108 @@ class MFRC522Handler:
 
         return
 
+    def write_verify_block(self, uid, block_num, data):
+        """
+        Writes 16 bytes to a block and reads it back in the same
+        authenticated session, no re-select between them.
+        Return the block data string read back, None if failed.
+        """
+        assert uid, f"Write block verify get error UID: {uid}"
+
+        # Check block is valid
+        assert block_num in range(64), f"block {block_num} is out of range(64)"
+
+        # Authenticate with the tag using the provided key
+        status = self.pcd_authenticate(
+            auth_mode=self.config.PICC_CMD_AUTH_KEY_A,
+            block_num=block_num, auth_key=self.auth_key, uid=uid)
+
+        block_data_s = None
+        if status == self.status.OK and self.write_block(block_num, data):
+            try:
+                block_data = self.read_block(block_num)
+                block_data_s = self.format_block_data(block_data)
+            except Exception as e:
+                logging.error("write_verify_block Error: %s", e)
+
+        # Stop cryptographic communication with the tag
+        self.pcd_stop_crypto_1()
+
+        return block_data_s
+
+    def write_blocks(self, uid, block_data_lst):
+        """
+        Writes [(block_num, data), ..] to the active PICC in one
+        authenticated session, the sector is authenticated only when
+        it changes, so blocks in the same Sector need no re-select.
+        Return False at the first failed block.
+        """
+        assert uid, f"Write blocks get error UID: {uid}"
+
+        sector_auth = None
+        is_ok = True
+        for block_num, data in block_data_lst:
+            # Check block is valid
+            assert block_num in range(64), \
+                f"block {block_num} is out of range(64)"
+
+            if block_num // 4 != sector_auth:
+                # Authenticate with the tag using the provided key
+                self.pcd_authenticate(
+                    auth_mode=self.config.PICC_CMD_AUTH_KEY_A,
+                    block_num=block_num, auth_key=self.auth_key, uid=uid)
+                sector_auth = block_num // 4
+
+            if not self.write_block(block_num, data):
+                is_ok = False
+                break
+
+        # Stop cryptographic communication with the tag
+        self.pcd_stop_crypto_1()
+
+        return is_ok
+
     def cal_blocks_sha256(self, uid):
         """
-        Calculate the SHA-256 of Sector 0~14.
+        Calculate the SHA-256 of Sector 0~14, return 32 bytes.
         Sector 15 is the Sector to write result, pass.
         """
-        block_data_lst = self.read_all_blocks(uid)
+        # Raw block bytes, no hex formatting to parse back
+        buf = bytearray(64 * self.config.BLOCK_SIZE)
+        self.read_all_blocks_into(uid, buf)
 
         assistant = HashAssistant()
-        # Get the data from block 0 to block 59
-        data_string = assistant.block_to_string(block_data_lst[:60])
-        sha256_hash_lst = assistant.hash_as_list(data_string)
-
-        return sha256_hash_lst
+        # Get the data from block 0 to block 59, hash them in one buffer
+        return assistant.hash_as_bytes(memoryview(buf)[:960])
 
     # Loops
+    def _retry_pause(self):
+        """
+        Wait a short fixed delay before the next retry.
+        """
+        delay = self.retry_delay
+        if self.reactor is not None:
+            self.reactor.pause(self.reactor.monotonic() + delay)
+        else:
+            time.sleep(delay)
+
+    def _retry_attempts(self, retry_times=None):
+        """
+        Yield attempt index for retry loops, pause before each retry.
+        retry_times defaults to self.retry_times.
+        """
+        if retry_times is None:
+            retry_times = self.retry_times
+        for attempt in range(retry_times):
+            if attempt:
+                self._retry_pause()
+            yield attempt
+
     def read_uid_loop(self):
         """
         Read the tag ID from the RFID tag.
         """
-        for _ in range(self.retry_times):
+        for _ in self._retry_attempts():
             uid = self.read_uid()
             if uid:
                 return uid
@@ -1695,30 +2216,43 @@ class MFRC522Handler:
         """
         Read the block data initially from the RFID tag.
         """
-        for _ in range(self.retry_times):
+        for _ in self._retry_attempts():
             uid, block_data = self.read_block_init(block_num)
             if uid:
                 return uid, block_data
         return None, None
 
     def read_all_loop(self, uid):
-        for _ in range(self.retry_times):
+        for _ in self._retry_attempts():
             block_data = self.read_all_blocks(uid)
             if block_data:
                 return block_data
         return None
 
-    def prepare_loop(self):
+    def read_all_buffer_loop(self, uid, out=None):
+        """
+        Read all 64 blocks into a contiguous bytearray(1024),
+        block n at [n*16:(n+1)*16], None if failed.
+        "out" is the caller-owned buffer to fill, new one if None.
+        """
+        if out is None:
+            out = bytearray(64 * self.config.BLOCK_SIZE)
+        for _ in self._retry_attempts():
+            present_mask = self.read_all_blocks_into(uid, out)
+            if present_mask == self.config.ALL_BLOCKS_MASK:
+                return out
+        return None
+
+    def prepare_loop(self, retry_times=None):
         """
         Begin the prepare loop, wait for the tag.
         """
-        for _ in range(self.retry_times):
+        for _ in self._retry_attempts(retry_times):
             uid = self._prepare()
             if uid:
                 return uid
         return None
 
-
 # ========================================================================
 # ---- Sample classes for testing----
 # MFRC522Service
@@ -1739,11 +2273,17 @@ class MFRC522Service:
 
         # Reschedule interval, seconds
         self.period = 0.25
+        # Back off while func returns nothing (no tag),
+        # period doubles per miss up to max_period
+        self._base_period = self.period
+        self._max_period = 2.0
+        self._miss_count = 0
 
     def start(self):
         if self.running:
             return False
         self.running = True
+        self._miss_count = 0
 
         waketime = self.reactor.monotonic() + self.period
         self.timer = self.reactor.register_timer(
@@ -1766,7 +2306,7 @@ class MFRC522Service:
         if self.func and self.running:
             # Return to skip
             logging.warning(
-                f"schedule func:{self.func} exists and running, skip...")
+                "schedule func:%s exists and running, skip...", self.func)
             return False
 
         self.func = func
@@ -1784,32 +2324,39 @@ class MFRC522Service:
 
     def periodic_task(self, eventtime):
         # logging.info(f"Periodic task executed at {eventtime}")
-        if self.func is None:
-            logging.warning(f"Schedule func not exists, return")
+        func = self.func
+        if func is None or self.timer is None:
+            logging.warning("Schedule func or timer not exists, return")
             return self.reactor.NEVER
 
-        if self.timer is None:
-            logging.warning(f"Schedule timer not exists, return")
-            return self.reactor.NEVER
+        params = self.params
+        result = func(**params) if params is not None else func()
 
-        result = self.func(**self.params) \
-            if self.params is not None \
-            else self.func()
+        callback = self.callback
+        if result and callback:
+            callback(result)
 
-        if result and self.callback:
-            self.callback(result)
-
-        # Re-register the timer for the next execution
-        next_waketime = self.reactor.monotonic() + self.period
-
-        if self.timer:
-            self.reactor.update_timer(self.timer, next_waketime)
-            # logging.info(f"Periodic task next_waketime: {next_waketime}")
-            return next_waketime
+        # Back off while nothing is found, reset on any result
+        if result is None:
+            miss_count = min(self._miss_count + 1, 8)
+            self._miss_count = miss_count
+            period = min(self._base_period * (1 << min(miss_count, 3)),
+                         self._max_period)
         else:
-            logging.info(f"Schedule timer not exists, return Never")
+            self._miss_count = 0
+            period = self._base_period
+
+        # func/callback may stop the service, check timer again
+        if self.timer is None:
+            logging.info("Schedule timer not exists, return Never")
             return self.reactor.NEVER
 
+        # Count from now but not eventtime, func may take a while.
+        # Returned waketime reschedules the timer, no update_timer() needed
+        next_waketime = self.reactor.monotonic() + period
+        # logging.info(f"Periodic task next_waketime: {next_waketime}")
+        return next_waketime
+
 
 class RFIDManager:
     def __init__(self, spi):
@@ -1845,9 +2392,9 @@ class RFIDManager:
             if block_data_lst:
                 block_data_lst.sort(reverse=True)
 
-                logging.info(f"Sector: {sector_num}")
+                logging.info("Sector: %s", sector_num)
                 for i,data in block_data_lst:
-                    logging.info(f"Block {i}: {data}")
+                    logging.info("Block %s: %s", i, data)
 
                 break
 
@@ -1858,20 +2405,20 @@ class RFIDManager:
             return
 
         uid_s = self.handler.format_block_data(uid)
-        logging.info(f"Card UID: {uid_s}")
+        logging.info("Card UID: %s", uid_s)
 
         block_data_lst = self.handler.read_all_loop(uid)
 
         if block_data_lst:
             # block_data_lst.sort(reverse=True)
             for i,data in block_data_lst:
-                logging.info(f"Block {i}: {data}")
+                logging.info("Block %s: %s", i, data)
 
     def rfid_block_init(self):
         # Read single block from init
         block_num = 0
         uid, block_data = self.handler.read_block_init_loop(block_num)
-        logging.info(f"Block {block_num}: {block_data}")
+        logging.info("Block %s: %s", block_num, block_data)
 
     def rfid_write_block(self, block_num, byte_array):
         # Write single block
@@ -1880,7 +2427,7 @@ class RFIDManager:
             return
 
         uid_s = self.handler.format_block_data(uid)
-        logging.info(f"Card UID: {uid_s}")
+        logging.info("Card UID: %s", uid_s)
 
         # block_num = 16
         # byte_array = [0x00,] * 16
@@ -1891,7 +2438,7 @@ class RFIDManager:
             blocks_read = self.handler.read_single_block(uid, block_num)
 
             if blocks_read:
-                logging.info(f"Block {block_num}: {blocks_read}")
+                logging.info("Block %s: %s", block_num, blocks_read)
 
     def rfid_write_hash(self):
         # Calculate hash block data and write into block 60/61
@@ -1900,17 +2447,17 @@ class RFIDManager:
             return
 
         uid_s = self.handler.format_block_data(uid)
-        logging.info(f"Card UID: {uid_s}")
+        logging.info("Card UID: %s", uid_s)
 
-        sha256_data_lst = self.handler.cal_blocks_sha256(uid)
+        sha256_data = memoryview(self.handler.cal_blocks_sha256(uid))
 
         block_num = 60
-        data = sha256_data_lst[:16]
+        data = sha256_data[:16]
         self.handler.prepare_loop()
         self.handler.write_single_block(uid, block_num, data)
 
         block_num = 61
-        data = sha256_data_lst[16:]
+        data = sha256_data[16:]
         self.handler.prepare_loop()
         self.handler.write_single_block(uid, block_num, data)
 
@@ -1939,28 +2486,29 @@ class RFIDManager:
         sector_15_lst = self.handler.read_sector(uid=uid, sector_num=15)
         sector_15_lst.sort(key=lambda tup: tup[0])
         # Filter block 60 & block 61 data
-        blocks_lst = list(filter(lambda tup: tup[0] in [60, 61], sector_15_lst))
+        blocks_lst = [tup for tup in sector_15_lst
+                      if tup[0] in _HASH_BLOCK_NUMS]
 
         assistant = HashAssistant()
         # Block data to string
         hash_read = assistant.block_to_string(blocks_lst)
-        logging.info(f"hash_read: {hash_read}")
+        logging.info("hash_read: %s", hash_read)
 
         # Validation schema
         if not hash_read:
-            logging.error(f"Hash block read error with UID: {uid_s}")
+            logging.error("Hash block read error with UID: %s", uid_s)
             return
 
         if not assistant.is_valid_length(hash_read):
-            logging.error(f"The hash data has wrong length: {hash_read}")
+            logging.error("The hash data has wrong length: %s", hash_read)
             return
 
         if not assistant.is_hexadecimal(hash_read):
-            logging.error(f"The hash data is not hex: {hash_read}")
+            logging.error("The hash data is not hex: %s", hash_read)
             return
 
         if assistant.has_high_zero_ratio(hash_read):
-            logging.error(f"The hash data has high zero ratio: {hash_read}")
+            logging.error("The hash data has high zero ratio: %s", hash_read)
             return
 
         # Get cached blocks data by uid string
@@ -1974,11 +2522,11 @@ class RFIDManager:
 
             # If cached blocks exists, find the cached block 60/61 first
             blocks_cached.sort(key=lambda tup: tup[0])
-            blocks_hash = list(
-                filter(lambda tup: tup[0] in [60, 61], blocks_cached))
+            blocks_hash = [tup for tup in blocks_cached
+                           if tup[0] in _HASH_BLOCK_NUMS]
 
             hash_cached = assistant.block_to_string(blocks_hash)
-            logging.info(f"hash_cached: {hash_cached}")
+            logging.info("hash_cached: %s", hash_cached)
 
             if hash_read == hash_cached:
                 # Read and cached hash data are the same, return cached data
@@ -2013,9 +2561,9 @@ class RFIDManager:
             # If new UID is not the same UID of begin,
             # a new Tag collision problem may happen, exit
             if uid_new_s != uid_s:
-                logging.info(f"UID begin: {uid_s}")
-                logging.info(f"UID current: {uid_new_s}")
-                logging.info(f"Found different UID, reload failed, exit.")
+                logging.info("UID begin: %s", uid_s)
+                logging.info("UID current: %s", uid_new_s)
+                logging.info("Found different UID, reload failed, exit.")
                 return
 
             # Read full blocks data
@@ -2028,7 +2576,7 @@ class RFIDManager:
                 blocks_read.sort(key=lambda tup: tup[0])
                 data_string = assistant.block_to_string(blocks_read[:60])
                 hash_calculate = assistant.hash_as_string(data_string)
-                logging.info(f"hash_calculate: {hash_calculate}")
+                logging.info("hash_calculate: %s", hash_calculate)
 
                 # Validation check
                 if hash_read != hash_calculate:
@@ -2039,12 +2587,13 @@ class RFIDManager:
                 # Cached the full blocks data
                 cache_key = self.cache.gen_key(uid_s)
                 self.cache.add(cache_key, blocks_read)
-                logging.info(f"RFID data success cached with UID: {uid_s}")
+                logging.info("RFID data success cached with UID: %s", uid_s)
                 # for i,data in blocks_read:
                 #     logging.info(f"Block {i}: {data}")
 
-                blocks_dct = {str(tup[0]):tup[1].replace(" ", "")
-                              for tup in blocks_read}
+                # Separators are stripped by from_blocks() on demand
+                blocks_dct = {str(block_num): block_data
+                              for block_num, block_data in blocks_read}
                 # logging.info(f"blocks_dct: {blocks_dct}")
 
                 rfid_model = RFIDModel()
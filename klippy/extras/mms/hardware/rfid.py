@@ -8,6 +8,7 @@ import json
 import os
 from contextlib import contextmanager
 from dataclasses import dataclass, field, fields
+from functools import lru_cache
 
 from ...bus import MCU_SPI_from_config
 
@@ -40,11 +41,17 @@ class RFIDConfig:
     # Timeout limit of detect/read, in seconds
     timeout: float = 60.0
 
-    skip_configs = [
+    skip_configs = frozenset((
         "printer_config",
         "period",
         "timeout",
-    ]
+    ))
+    type_method_map = {
+        str: "get",
+        int: "getint",
+        float: "getfloat",
+        list: "getintlist",
+    }
     # ==== configuration values in *.cfg, must set default  ====
     # Retreat distance after load to gate, in mm
     cs_pin: str = ""
@@ -53,28 +60,13 @@ class RFIDConfig:
     rfid_data_file: str = ""
 
     def __post_init__(self):
-        type_method_map = {
-            str: "get",
-            int: "getint",
-            float: "getfloat",
-            list: "getintlist",
-        }
-
-        for field_info in fields(self):
-            field_name = field_info.name
-            field_type = field_info.type
-
-            if field_name in self.skip_configs:
-                continue
-
+        # (field_name, get_method) resolved once, see _RFID_CONFIG_PLAN
+        for field_name, get_method in _RFID_CONFIG_PLAN:
             if field_name=="slots":
                 self._parse_string_list(field_name="slots")
                 continue
 
-            # Default type is str
-            get_method = type_method_map.get(field_type, "get")
             config_value = getattr(self.printer_config, get_method)(field_name)
-
             object.__setattr__(self, field_name, config_value)
 
     def _parse_string_list(self, field_name):
@@ -83,18 +75,58 @@ class RFIDConfig:
         return lst
 
 
+# Config fields to parse, (field_name, get_method), default type is str
+_RFID_CONFIG_PLAN = tuple(
+    (f.name, RFIDConfig.type_method_map.get(f.type, "get"))
+    for f in fields(RFIDConfig)
+    if f.name not in RFIDConfig.skip_configs
+)
+
+
+@lru_cache(maxsize=16)
+def _blocks_to_json(blocks_bytes):
+    """
+    Decode the data of block 0~59 to RFIDModel json.
+    Deterministic, memoized by content, tags with the same
+    data share the json.
+    """
+    blocks_dct = {}
+    for block_num in range(len(blocks_bytes) // 16):
+        offset = block_num * 16
+        blocks_dct[str(block_num)] = (
+            blocks_bytes[offset:offset + 16].hex().upper())
+
+    rfid_model = RFIDModel()
+    rfid_model.from_blocks(blocks_dct)
+    return rfid_model.to_json()
+
+
 class RFIDManager:
     def __init__(self, spi):
-        self.handler = MFRC522Handler(spi)
+        self.handler = MFRC522Handler(
+            spi, reactor=printer_adapter.get_reactor())
         self.hash_assistant = HashAssistant()
 
         self._initialize_loggers()
 
         # Default max_size=16
         cache_max_size = 32
-        self.cache = RFIDCache(max_size=cache_max_size)
+        # Keep Tags hit again and again, e.g. the loaded slots,
+        # in the protected segment
+        self.cache = RFIDCache(max_size=cache_max_size, verify=True,
+                               protected_size=cache_max_size // 2)
         # self.retry_times = 10
 
+        # Within the TTL after a verified read, return the result
+        # of the same UID without reading Sector 15 again, in seconds
+        self.verified_ttl = 0.5
+
+        # Attempts to find a Tag per rfid_read() call. The read is
+        # polled by PeriodicTask, which is the retry itself, so no Tag
+        # costs one REQA per period but not a full backoff loop
+        self.probe_retry_times = 1
+
+
     def _initialize_loggers(self):
         mms_logger = printer_adapter.get_mms_logger()
         self.log_info = mms_logger.create_log_info(console_output=True)
@@ -113,9 +145,49 @@ class RFIDManager:
         with self.handler.antenna_manager():
             yield
 
+    def _uid_keys(self, uid):
+        """
+        Cache keys of raw UID, (kind, uid_bytes) tuples, no hex
+        formatting needed.
+        Return (blocks_key, dict_key, hash_key).
+        """
+        uid_b = bytes(uid)
+        return (("rfid_blocks", uid_b),
+                ("rfid_dict", uid_b),
+                ("rfid_hash", uid_b))
+
+    def _cache_verified(self, uid, hash_read, rfid_model_json):
+        # Remember the verified result of UID, see verified_ttl
+        hash_key = self._uid_keys(uid)[2]
+        self.cache.add_timed(hash_key, (hash_read, rfid_model_json))
+
+    def invalidate(self, uid):
+        """
+        Drop all cached data of raw UID, after the Tag is written.
+        """
+        for cache_key in self._uid_keys(uid):
+            self.cache.remove(cache_key)
+
+    def _pick_hash_blocks(self, blocks_lst):
+        """
+        Return [block 60, block 61] from (block_num, block_data) tuples,
+        or an empty list if either of them is missing.
+        """
+        block_60 = block_61 = None
+        # One pass, keep only block 60/61
+        for tup in blocks_lst:
+            if tup[0] == 60:
+                block_60 = tup
+            elif tup[0] == 61:
+                block_61 = tup
+
+        if block_60 is None or block_61 is None:
+            return []
+        return [block_60, block_61]
+
     def get_version(self):
         with self.use_antenna():
-            return hex(self.handler.get_version()).upper().zfill(2)
+            return f"0x{self.handler.get_version():02X}"
         # self.log_info(f"Firmware Version: {version}")
 
     def get_uid(self):
@@ -127,11 +199,11 @@ class RFIDManager:
             self.handler.picc_select(uid)
 
             # Read the Sector 15 to get hash data, prepare have done before
-            sector_15_lst = self.handler.read_sector(uid=uid, sector_num=15)
-            sector_15_lst.sort(key=lambda tup: tup[0])
-            # Filter block 60 & block 61 data
-            blocks_lst = list(filter(lambda tup: tup[0] in [60, 61],
-                                     sector_15_lst))
+            # Only block 60/61 hold the hash, skip block 62/63
+            sector_15_lst = self.handler.read_sector(
+                uid=uid, sector_num=15, block_nums=(60, 61))
+            # Pick block 60 & block 61 data
+            blocks_lst = self._pick_hash_blocks(sector_15_lst)
 
             # Block data to string
             hash_read = self.hash_assistant.block_to_string(blocks_lst)
@@ -147,59 +219,55 @@ class RFIDManager:
             hash data calculate from full blocks data read from Tag
         """
         with self.use_antenna():
-            uid = self.handler.prepare_loop()
+            uid = self.handler.prepare_loop(
+                retry_times=self.probe_retry_times)
             if not uid:
                 self.log_info_s("No Tag, return")
                 return
 
+            blocks_key, dict_key, hash_key = self._uid_keys(uid)
+
+            # Fast path, same UID verified just now
+            verified = self.cache.get_fresh(hash_key, self.verified_ttl)
+            if verified:
+                self.log_info_s("verified recently, return json cached")
+                return verified[1]
+
+            # Hex UID only for logs from here on
             uid_s = self.handler.format_block_data(uid)
-            # self.log_info_s(f"Tag uid={uid_s}")
 
             # Read the Sector 15 to get hash data, prepare have done before
-            sector_15_lst = self.handler.read_sector(uid=uid, sector_num=15)
-            sector_15_lst.sort(key=lambda tup: tup[0])
-            # Filter block 60 & block 61 data
-            blocks_lst = list(filter(lambda tup: tup[0] in [60, 61],
-                                     sector_15_lst))
+            # Only block 60/61 hold the hash, skip block 62/63
+            sector_15_lst = self.handler.read_sector(
+                uid=uid, sector_num=15, block_nums=(60, 61))
+            # Pick block 60 & block 61 data
+            blocks_lst = self._pick_hash_blocks(sector_15_lst)
 
             # Block data to string
             hash_read = self.hash_assistant.block_to_string(blocks_lst)
-            self.log_info_s(f"hash_read: {hash_read}")
+            self.log_info_s("hash_read: %s", hash_read)
 
             # Validation schema
             if not hash_read:
                 self.log_error(f"Hash block read error with UID: {uid_s}")
                 return
 
-            if not self.hash_assistant.is_valid_length(hash_read):
-                self.log_error(f"The hash data has wrong length: {hash_read}")
-                return
-
-            if not self.hash_assistant.is_hexadecimal(hash_read):
-                self.log_error(f"The hash data is not hex: {hash_read}")
-                return
-
-            if self.hash_assistant.has_high_zero_ratio(hash_read):
-                self.log_error(f"The hash data has high zero ratio:"
-                               f" {hash_read}")
+            err_reason = self.hash_assistant.check_hash(hash_read)
+            if err_reason:
+                self.log_error(f"The hash data {err_reason}: {hash_read}")
                 return
 
             # Get cached blocks data by uid string
-            cache_key = self.cache.gen_key(uid_s)
-            blocks_cached = self.cache.get(cache_key)
+            blocks_cached = self.cache.get(blocks_key)
             # Reload flag init False
             need_reload = False
 
             if blocks_cached:
                 self.log_info_s("cache load")
 
-                # If cached blocks exists, find the cached block 60/61 first
-                blocks_cached.sort(key=lambda tup: tup[0])
-                blocks_hash = list(
-                    filter(lambda tup: tup[0] in [60, 61], blocks_cached))
-
-                hash_cached = self.hash_assistant.block_to_string(blocks_hash)
-                self.log_info_s(f"hash_cached: {hash_cached}")
+                # Cached with the hash validated when loaded
+                blocks_cached, hash_cached = blocks_cached
+                self.log_info_s("hash_cached: %s", hash_cached)
 
                 if hash_read == hash_cached:
                     # Read and cached hash data are the same,
@@ -210,10 +278,11 @@ class RFIDManager:
                     # for i,data in blocks_cached:
                     #     self.log_info_s(f"Block {i}: {data}")
 
-                    cache_key = self.cache.gen_key(uid_s, prefix="rfid_dict")
-                    rfid_model_json = self.cache.get(cache_key)
+                    rfid_model_json = self.cache.get(dict_key)
                     # self.log_info_s(rfid_model_json)
 
+                    if rfid_model_json:
+                        self._cache_verified(uid, hash_read, rfid_model_json)
                     return rfid_model_json
 
                 else:
@@ -243,19 +312,17 @@ class RFIDManager:
                     self.log_info_s(f"found different UID, reload failed, exit")
                     return
 
-                # Read full blocks data
-                blocks_read = self.handler.read_all_loop(uid)
+                # Read full blocks data, block n at [n*16:(n+1)*16]
+                blocks_read = self.handler.read_all_buffer_loop(uid)
 
                 if blocks_read:
                     # Calculate and check hash_block is valid
+                    view = memoryview(blocks_read)
 
                     # Get the data from block 0 to block 59
-                    blocks_read.sort(key=lambda tup: tup[0])
-                    data_string = (
-                        self.hash_assistant.block_to_string(blocks_read[:60]))
                     hash_calculate = (
-                        self.hash_assistant.hash_as_string(data_string))
-                    self.log_info_s(f"hash_calculate: {hash_calculate}")
+                        self.hash_assistant.hash_as_string(view[:960]))
+                    self.log_info_s("hash_calculate: %s", hash_calculate)
 
                     # Validation check
                     if hash_read != hash_calculate:
@@ -264,24 +331,15 @@ class RFIDManager:
                         return
 
                     # Cached the full blocks data
-                    cache_key = self.cache.gen_key(uid_s)
-                    self.cache.add(cache_key, blocks_read)
-                    self.log_info_s(f"RFID data success cached with UID: {uid_s}")
-                    # for i,data in blocks_read:
-                    #     self.log_info_s(f"Block {i}: {data}")
-
-                    blocks_dct = {
-                        str(tup[0]):tup[1].replace(" ", "")
-                        for tup in blocks_read
-                    }
-                    # self.log_info_s(f"blocks_dct: {blocks_dct}")
+                    self.cache.add(blocks_key, (blocks_read, hash_calculate))
+                    self.log_info_s(
+                        "RFID data success cached with UID: %s", uid_s)
 
-                    rfid_model = self.new_rfid_model()
-                    rfid_model.from_blocks(blocks_dct)
-                    rfid_model_json = rfid_model.to_json()
+                    # Same content decodes to the same json
+                    rfid_model_json = _blocks_to_json(bytes(view[:960]))
 
-                    cache_key = self.cache.gen_key(uid_s, prefix="rfid_dict")
-                    self.cache.add(cache_key, rfid_model_json)
+                    self.cache.add(dict_key, rfid_model_json)
+                    self._cache_verified(uid, hash_read, rfid_model_json)
                     # self.log_info_s(rfid_model_json)
 
                     return rfid_model_json
@@ -302,19 +360,75 @@ class RFIDManager:
 
             uid_s = self.handler.format_block_data(uid)
             self.log_info_s(f"Card UID: {uid_s}")
+            # Tag data is changing, drop cached data
+            self.invalidate(uid)
 
             # block_num = 16
             # byte_array = [0x00,] * 16
-            self.handler.write_single_block(uid, block_num, byte_array)
+            # Write and read back in one session
+            blocks_read = self.handler.write_verify_block(
+                uid, block_num, byte_array)
+            if blocks_read:
+                self.log_info_s(f"Block {block_num}: {blocks_read}")
+                return True
 
+            return False
+
+    def rfid_write_blocks(self, prepared_blocks, with_hash=False):
+        """
+        Write {block_num: byte_array} in one session, the sector is
+        authenticated only once for its blocks, then verify all of
+        them with one read of the full Tag.
+
+        - with_hash: Also write the SHA-256 of block 0~59 into
+          block 60/61, calculated from the verify read, in the same
+          antenna session, same as rfid_write_hash().
+        """
+        with self.use_antenna():
             uid = self.handler.prepare_loop()
-            if uid:
-                blocks_read = self.handler.read_single_block(uid, block_num)
-                if blocks_read:
-                    self.log_info_s(f"Block {block_num}: {blocks_read}")
-                    return True
+            if not uid:
+                return False
 
-            return False
+            uid_s = self.handler.format_block_data(uid)
+            self.log_info_s(f"Card UID: {uid_s}")
+            # Tag data is changing, drop cached data
+            self.invalidate(uid)
+
+            # Sort by block_num, blocks of a sector are written together
+            block_data_lst = sorted(prepared_blocks.items())
+            if not self.handler.write_blocks(uid, block_data_lst):
+                self.log_error(f"RFID write blocks failed with UID: {uid_s}")
+                return False
+
+            # Read back to verify
+            uid = self.handler.prepare_loop()
+            if not uid:
+                return False
+            blocks_read = self.handler.read_all_buffer_loop(uid)
+            if not blocks_read:
+                return False
+
+            for block_num, byte_array in block_data_lst:
+                offset = block_num * 16
+                if blocks_read[offset:offset + 16] != bytes(byte_array):
+                    self.log_error(f"Block {block_num} verify failed")
+                    return False
+
+            if not with_hash:
+                return True
+
+            # Hash the verified data, no extra read of all blocks
+            sha256_data = memoryview(self.hash_assistant.hash_as_bytes(
+                memoryview(blocks_read)[:960]))
+
+            # Crypto is stopped after read, select again
+            uid = self.handler.prepare_loop()
+            if not uid:
+                return False
+            return self.handler.write_blocks(uid, [
+                (60, sha256_data[:16]),
+                (61, sha256_data[16:]),
+            ])
 
     def rfid_write_hash(self):
         with self.use_antenna():
@@ -325,18 +439,18 @@ class RFIDManager:
 
             uid_s = self.handler.format_block_data(uid)
             self.log_info_s(f"Card UID: {uid_s}")
+            # Tag data is changing, drop cached data
+            self.invalidate(uid)
 
-            sha256_data_lst = self.handler.cal_blocks_sha256(uid)
-
-            block_num = 60
-            data = sha256_data_lst[:16]
-            self.handler.prepare_loop()
-            self.handler.write_single_block(uid, block_num, data)
+            # Slices of memoryview are not copied
+            sha256_data = memoryview(self.handler.cal_blocks_sha256(uid))
 
-            block_num = 61
-            data = sha256_data_lst[16:]
+            # Block 60/61 are in Sector 15, write them in one session
             self.handler.prepare_loop()
-            self.handler.write_single_block(uid, block_num, data)
+            self.handler.write_blocks(uid, [
+                (60, sha256_data[:16]),
+                (61, sha256_data[16:]),
+            ])
 
     def get_tags(self):
         with self.use_antenna():
@@ -359,6 +473,8 @@ class MMSRfid:
         self.name = config.get_name().split()[-1]
         self.is_detecting = False
         self.is_reading = False
+        # RFIDManager is created on first use, see get_rfid_manager()
+        self.rfid_manager = None
 
         self.rfid_config = RFIDConfig(config)
         # Parse params
@@ -382,7 +498,6 @@ class MMSRfid:
         self._initialize_loggers()
         self._initialize_gcode()
         self._initialize_task()
-        self._initialize_manager()
 
     def _initialize_loggers(self):
         mms_logger = printer_adapter.get_mms_logger()
@@ -421,6 +536,11 @@ class MMSRfid:
     def _initialize_manager(self):
         self.rfid_manager = RFIDManager(self.spi)
 
+    def get_rfid_manager(self):
+        if self.rfid_manager is None:
+            self._initialize_manager()
+        return self.rfid_manager
+
     # ---- Tag write ----
     def _load_rfid_file(self):
          # Most likely return "/home/.../printer_data/config/printer.cfg"
@@ -433,30 +553,34 @@ class MMSRfid:
         full_path = None
         json_data = None
 
-        for root, _, files in os.walk(base_dir):
-            if filename in files:
-                full_path = os.path.join(root, filename)
-                if self.rfid_data_file in full_path:
-                    try:
-                        with open(full_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        json_data = json.loads(content)
-                    except json.JSONDecodeError as e:
-                        self.log_error(f"JSON decode error ({full_path}): {e}")
-                    except Exception as e:
-                        self.log_error(f"open file error {full_path}: {e}")
+        # Most likely the path is given relative to base_dir,
+        # walk the config tree only if it is not there
+        direct_path = os.path.join(base_dir, self.rfid_data_file)
+        if os.path.isfile(direct_path):
+            full_path = direct_path
+        else:
+            for root, _, files in os.walk(base_dir):
+                if filename in files:
+                    path = os.path.join(root, filename)
+                    if self.rfid_data_file in path:
+                        full_path = path
+                        break
 
-        return full_path, json_data
+        if full_path is None:
+            self.log_error(f"rfid file not found: {self.rfid_data_file}")
+            return full_path, json_data
 
-        # full_path = os.path.join(base_dir, self.rfid_data_file)
-        # try:
-        #     with open(full_path, 'r', encoding='utf-8') as f:
-        #         content = f.read()
-        #     json_data = json.loads(content)
-        # except json.JSONDecodeError as e:
-        #     self.log_error(f"JSON decode error ({full_path}): {e}")
-        # except Exception as e:
-        #     self.log_error(f"open file error {full_path}: {e}")
+        try:
+            # json.loads() takes UTF-8 bytes, no decoding to str first
+            with open(full_path, 'rb') as f:
+                content = f.read()
+            json_data = json.loads(content)
+        except json.JSONDecodeError as e:
+            self.log_error(f"JSON decode error ({full_path}): {e}")
+        except Exception as e:
+            self.log_error(f"open file error {full_path}: {e}")
+
+        return full_path, json_data
 
     def write(self):
         full_path, json_data = self._load_rfid_file()
@@ -467,11 +591,11 @@ class MMSRfid:
             return False
 
         # Setup model
-        rfid_model = self.rfid_manager.new_rfid_model()
+        rfid_model = self.get_rfid_manager().new_rfid_model()
         rfid_model.from_dict(json_data)
 
         # Log data
-        data_encode_json = rfid_model.to_json()
+        data_encode_json = rfid_model.to_json_pretty()
         self.log_info(
             f"RFID[{self.name}] write\n"
             "load data from file:\n"
@@ -482,17 +606,16 @@ class MMSRfid:
 
         # Write to tag
         prepared_blocks = rfid_model.prepare_blocks_writing()
-        for block_num, byte_array in prepared_blocks.items():
-            success = self.rfid_manager.rfid_write_block(block_num, byte_array)
-            if not success:
-                return False
+        success = self.get_rfid_manager().rfid_write_blocks(
+            prepared_blocks, with_hash=True)
+        if not success:
+            return False
 
-        self.rfid_manager.rfid_write_hash()
         return True
 
     # ---- Tag detect ----
     def detect_begin(self, callback):
-        func = self.rfid_manager.get_uid
+        func = self.get_rfid_manager().get_uid
 
         try:
             is_ready = self.periodic_task.schedule(
@@ -528,7 +651,7 @@ class MMSRfid:
 
     def _handle_detected(self, data):
         if data and self.detect_end():
-            uid = self.rfid_manager.to_string(block_data=data)
+            uid = self.get_rfid_manager().to_string(block_data=data)
             self.log_info(
                 f"RFID[{self.name}] detect Tag uid:\n"
                 f"{uid}"
@@ -536,7 +659,7 @@ class MMSRfid:
 
     # ---- Tag read ----
     def read_begin(self, callback):
-        func = self.rfid_manager.rfid_read
+        func = self.get_rfid_manager().rfid_read
 
         try:
             is_ready = self.periodic_task.schedule(
@@ -580,7 +703,7 @@ class MMSRfid:
 
     # ---- Dev ----
     def get_tags_begin(self, callback):
-        func = self.rfid_manager.get_tags
+        func = self.get_rfid_manager().get_tags
 
         try:
             is_ready = self.periodic_task.schedule(
@@ -646,7 +769,7 @@ class MMSRfid:
         self.log_info(f"RFID[{self.name}] write finish")
 
     # def cmd_MMS_RFID_READ_TAGS(self, gcmd):
-    #     self.rfid_manager.get_tags()
+    #     self.get_rfid_manager().get_tags()
 
 
 def load_config(config):
@@ -5,7 +5,6 @@
 # This file may be distributed under the terms of the GNU GPLv3 license.
 
 import json
-import time
 from contextlib import contextmanager
 from dataclasses import dataclass
 
@@ -22,6 +21,19 @@ from ..adapters import (
     toolhead_adapter as toolhead_a
 )
 
+# Adapters are singletons, bind the methods used on move paths once
+_mq_move = motion_queuing_a.move
+_mq_setup_trapq = motion_queuing_a.setup_trapq
+_mq_drip_update_time = motion_queuing_a.drip_update_time
+_mq_wipe_trapq = motion_queuing_a.wipe_trapq
+_se_is_enabled = stepper_enable_a.is_motor_enabled
+_se_enable = stepper_enable_a.enable
+_se_disable = stepper_enable_a.disable
+_th_get_print_time = toolhead_a.get_print_time
+_th_dwell = toolhead_a.dwell
+_notify_running = printer_adapter.notify_mms_stepper_running
+_notify_idle = printer_adapter.notify_mms_stepper_idle
+
 
 # ------------------------------
 # Configuration and Constants
@@ -38,25 +50,36 @@ class StepperConfig:
     # soft_stop_delay: float = 0.15
 
 
-@dataclass(frozen=True)
 class MoveType:
-    MANUAL_MOVE: str = "manual_move"
-    MANUAL_HOME: str = "manual_home"
-    DRIP_MOVE: str = "drip_move"
+    # Int constants, also index of MMSStepper.move_dispatch_lst
+    MANUAL_MOVE = 0
+    MANUAL_HOME = 1
+    DRIP_MOVE = 2
+    # Readable names for status and logs, indexed by value
+    NAMES = ("manual_move", "manual_home", "drip_move")
+
+    @classmethod
+    def get_name(cls, move_type):
+        return cls.NAMES[move_type] if move_type is not None else ""
 
 
-@dataclass(frozen=True)
 class MoveStatus:
-    READY: str = "ready"
-    MOVING: str = "moving"
+    READY = 0
+    MOVING = 1
     # Completed by pin triggered/released
-    COMPLETED: str = "completed"
+    COMPLETED = 2
     # Terminated by Commands
-    TERMINATED: str = "terminated"
+    TERMINATED = 3
     # Move end without completed or terminated
-    EXPIRED: str = "expired"
+    EXPIRED = 4
     # Error raised by GCode, such as CommandError
-    ERROR: str = "error"
+    ERROR = 5
+    # Readable names for status and logs, indexed by value
+    NAMES = ("ready", "moving", "completed", "terminated", "expired", "error")
+
+    @classmethod
+    def get_name(cls, move_status):
+        return cls.NAMES[move_status]
 
 
 # ------------------------------
@@ -64,23 +87,44 @@ class MoveStatus:
 # ------------------------------
 class MoveDispatch:
     """Base class for all movement dispatches"""
+    __slots__ = (
+        "stepper", "reactor", "_monotonic", "trapq", "s_config", "move_type",
+        "steps_moved", "distance_moved", "_completion", "_free_completion",
+        "_step_dist",
+        "_start_step", "_get_mcu_position",
+        "log_info", "log_error",
+    )
+
     def __init__(self, stepper):
         self.stepper = stepper
         self.reactor = printer_adapter.get_reactor()
-        self.trapq = motion_queuing_a.allocate_trapq()
+        # Bound once, the reactor clock is read on every move
+        self._monotonic = self.reactor.monotonic
+        # Allocated on first use, see _get_trapq()
+        self.trapq = None
 
         self.s_config = StepperConfig()
         self.move_type = None
 
         self.steps_moved = 0
         self.distance_moved = 0.0
+        # MCU position when the current move began
+        self._start_step = 0
         self._completion = None
+        # A timed out completion is never completed, keep it for next wait
+        self._free_completion = None
+        # Resolved in klippy ready, stepper is connected by then
+        self._step_dist = None
+        self._get_mcu_position = None
 
         printer_adapter.register_klippy_ready(
             self._handle_klippy_ready)
 
     def _handle_klippy_ready(self):
         self._initialize_loggers()
+        self._step_dist = self.stepper.get_step_dist()
+        self._get_mcu_position = \
+            self.stepper.get_mcu_stepper().get_mcu_position
 
     def _initialize_loggers(self):
         mms_logger = printer_adapter.get_mms_logger()
@@ -96,7 +140,8 @@ class MoveDispatch:
     def _prepare_tracking(self):
         """Reset movement tracking variables"""
         self.stepper.reset_position()
-        self.steps_moved = self.stepper.get_step()
+        self._start_step = self._get_mcu_position()
+        self.steps_moved = 0
         # self.distance_moved = self.stepper.get_position()
         self.distance_moved = 0
 
@@ -110,17 +155,25 @@ class MoveDispatch:
         # because stepper_position would be reset inside homing_move()
         # and the result may always be the params "distance"
         # So calculate by step_dist * steps_moved
-        self.steps_moved = self.stepper.get_step() - self.steps_moved
-        self.distance_moved = self.stepper.get_step_dist() * self.steps_moved
+        end_step = self._get_mcu_position()
+        self.steps_moved = end_step - self._start_step
+        self.distance_moved = self._step_dist * self.steps_moved
         self.stepper.reset_position()
 
     def terminate(self):
         return
 
     # ---- Trapq control ----
+    def _get_trapq(self):
+        # Shared with the other dispatches of this stepper,
+        # ManualHomeDispatch moves through HomingMove and never needs one
+        if self.trapq is None:
+            self.trapq = self.stepper.get_trapq()
+        return self.trapq
+
     def _replace_trapq(self):
         # Return origin trap_queue
-        return self.stepper.set_trapq(self.trapq)
+        return self.stepper.set_trapq(self._get_trapq())
 
     def _recover_trapq(self, prev_trapq):
         # Recover preview trapq
@@ -128,25 +181,24 @@ class MoveDispatch:
 
     # ---- Reactor waiting ----
     def _query_current(self):
-        return self.reactor.monotonic()
+        return self._monotonic()
 
     def _wait(self, delay):
-        end_time = self._query_current() + delay
-        self._completion = self.reactor.completion()
-
-        while 1:
-            # Complete
-            result = self._completion.wait(end_time)
-            if result is not None:
-                break
-            # Timeout
-            if self._query_current() > end_time:
-                self._completion.complete(False)
-                break
-
+        end_time = self._monotonic() + delay
+        completion = self._free_completion
+        if completion is None or completion.test():
+            completion = self.reactor.completion()
+        self._free_completion = None
+        self._completion = completion
+        # One timed wait, the reactor wakes us either at end_time
+        # or early by _complete_waiting(). completion.wait() already
+        # pauses on a reactor timer at end_time, no extra deadline
+        # timer is needed.
+        completion.wait(end_time)
         self._completion = None
-        duration = self._query_current() + delay - end_time
-        return duration
+        if not completion.test():
+            # Timed out, the completion is still unused
+            self._free_completion = completion
 
     def _complete_waiting(self, result=False):
         if self._completion:
@@ -157,31 +209,44 @@ class MoveDispatch:
 
 
 class ManualMoveDispatch(MoveDispatch):
+    __slots__ = ()
+
     def __init__(self, stepper):
         super().__init__(stepper)
         self.move_type = MoveType.MANUAL_MOVE
 
     def execute(self, print_time, distance, speed, accel):
+        if abs(distance) < 0.5 * self._step_dist:
+            # Rounds to zero steps, nothing to queue or wait for
+            self.steps_moved = 0
+            self.distance_moved = 0
+            return print_time
+
         # Save original trapq and replace with ours
         prev_trapq = self._replace_trapq()
         self._prepare_tracking()
         try:
             # Process move jobs in trapq, return end_print_time
-            end_print_time = motion_queuing_a.move(
+            end_print_time = _mq_move(
                 self.trapq, print_time, distance, speed, accel
             )
             delay = end_print_time - print_time
             self._wait(delay)
             return end_print_time
 
-        except Exception as e:
-            self.log_error(f"{self.move_type} error: {str(e)}")
+        except (CommandError, MCUError) as e:
+            # Log and raise, never leave the caller a None end_print_time
+            self.log_error(
+                f"{MoveType.get_name(self.move_type)} error: {str(e)}")
+            raise
         finally:
             self._recover_trapq(prev_trapq)
             self._update_tracking()
 
 
 class ManualHomeDispatch(MoveDispatch):
+    __slots__ = ("mcu_pin_lst",)
+
     def __init__(self, stepper):
         super().__init__(stepper)
         self.move_type = MoveType.MANUAL_HOME
@@ -193,8 +258,7 @@ class ManualHomeDispatch(MoveDispatch):
         self._prepare_tracking()
 
         try:
-            ms_adapter = manual_stepper_dispatch.get_adapter(
-                self.stepper.get_name())
+            ms_adapter = self.stepper.get_ms_adapter()
             ms_adapter.set_home_accel(accel)
 
             # Homing move
@@ -219,10 +283,12 @@ class ManualHomeDispatch(MoveDispatch):
 
         except (CommandError, MCUError) as e:
             # Raise CommandError or MCUError
-            self.log_error(f"{self.move_type} error: {str(e)}")
+            self.log_error(
+                f"{MoveType.get_name(self.move_type)} error: {str(e)}")
             raise
         except Exception as e:
-            self.log_error(f"{self.move_type} error: {str(e)}")
+            self.log_error(
+                f"{MoveType.get_name(self.move_type)} error: {str(e)}")
         finally:
             self._update_tracking()
             # Truncate mcu_pin list
@@ -233,6 +299,8 @@ class ManualHomeDispatch(MoveDispatch):
 
 
 class DripMoveDispatch(MoveDispatch):
+    __slots__ = ("_drip_completion",)
+
     def __init__(self, stepper):
         super().__init__(stepper)
         self.move_type = MoveType.DRIP_MOVE
@@ -244,7 +312,7 @@ class DripMoveDispatch(MoveDispatch):
         self._prepare_tracking()
         try:
             # Setup move jobs in trapq, return end_print_time
-            end_print_time = motion_queuing_a.setup_trapq(
+            end_print_time = _mq_setup_trapq(
                 self.trapq, print_time, distance, speed, accel
             )
             # Setup reactor completion
@@ -253,11 +321,11 @@ class DripMoveDispatch(MoveDispatch):
             begin_at = self._query_current()
 
             # Drip updates to motors, move begin
-            motion_queuing_a.drip_update_time(
+            _mq_drip_update_time(
                 print_time, end_print_time, self._drip_completion
             )
             # Move finish, clear remaining movement in trapq
-            motion_queuing_a.wipe_trapq(self.trapq)
+            _mq_wipe_trapq(self.trapq)
             # Truncate reactor completion
             self._drip_completion = None
 
@@ -267,7 +335,8 @@ class DripMoveDispatch(MoveDispatch):
             return min(print_time+duration, end_print_time)
 
         except Exception as e:
-            self.log_error(f"{self.move_type} error: {str(e)}")
+            self.log_error(
+                f"{MoveType.get_name(self.move_type)} error: {str(e)}")
         finally:
             self._recover_trapq(prev_trapq)
             self._update_tracking()
@@ -282,12 +351,36 @@ class DripMoveDispatch(MoveDispatch):
 # ------------------------------
 class MMSStepper:
     """Main stepper motor control class"""
+    __slots__ = (
+        "name", "reactor", "_monotonic", "s_config",
+        "interval_time", "wait_delay",
+        # State management
+        "mms_name", "_index", "_focus_slot", "_is_running", "_forward",
+        "_end_print_time", "_can_calibrate",
+        # Move status
+        "move_type", "move_status", "move_end_at", "move_end_steps",
+        "_active_dispatch",
+        # MCU objects
+        "_mcu_stepper", "_mcu", "_step_dist", "_ms_adapter", "_trapq",
+        # Status templates
+        "_status_template", "_mcu_stepper_status_template",
+        "_mcu_status_template",
+        "_manual_move_dispatch", "_manual_home_dispatch",
+        "_drip_move_dispatch", "move_dispatch_lst",
+        "log_info", "log_warning",
+    )
+
     def __init__(self, name):
         self.name = name
         self.reactor = printer_adapter.get_reactor()
+        # Bound once, the reactor clock is read on every move
+        self._monotonic = self.reactor.monotonic
 
         # Configuration
         self.s_config = StepperConfig()
+        # Read per move, copied from the frozen config once
+        self.interval_time = self.s_config.interval_time
+        self.wait_delay = self.s_config.wait_delay
 
         # State management
         self.mms_name = None
@@ -299,19 +392,36 @@ class MMSStepper:
         self._can_calibrate = True
 
         # Move status
-        self.move_type = ""
+        self.move_type = None
+        # Dispatch of the current/last move, follows move_type
+        self._active_dispatch = None
         self._reset_move_status(MoveStatus.READY)
 
-        # Setup and register mcu objects
+        # Setup and register mcu objects, resolved in klippy connect
         self._mcu_stepper = None
         self._mcu = None
+        self._step_dist = None
+        self._ms_adapter = None
+        # Trapq shared by move dispatches, allocated on first use.
+        # Moves never overlap (see _stepper_is_running) and each move
+        # wipes the trapq before appending.
+        self._trapq = None
+
+        # Status dicts with static fields filled, copied per query
+        self._status_template = None
+        self._mcu_stepper_status_template = None
+        self._mcu_status_template = None
 
         # Initialize movement dispatch with self
-        self.move_dispatch_dct = {
-            MoveType.MANUAL_MOVE: ManualMoveDispatch(self),
-            MoveType.MANUAL_HOME: ManualHomeDispatch(self),
-            MoveType.DRIP_MOVE: DripMoveDispatch(self),
-        }
+        self._manual_move_dispatch = ManualMoveDispatch(self)
+        self._manual_home_dispatch = ManualHomeDispatch(self)
+        self._drip_move_dispatch = DripMoveDispatch(self)
+        # Indexed by MoveType value
+        self.move_dispatch_lst = (
+            self._manual_move_dispatch,
+            self._manual_home_dispatch,
+            self._drip_move_dispatch,
+        )
 
         # Register connect handler to printer
         printer_adapter.register_klippy_connect(
@@ -319,6 +429,15 @@ class MMSStepper:
 
     def _handle_klippy_connect(self):
         self._initialize_loggers()
+        self._initialize_mcu_objects()
+
+    def _initialize_mcu_objects(self):
+        # Steppers are registered to force_move while loading config,
+        # resolve them once here so hot paths are plain attribute reads
+        self._mcu_stepper = force_move_a.get_mcu_stepper(self.name)
+        self._mcu = self._mcu_stepper.get_mcu()
+        self._step_dist = self._mcu_stepper.get_step_dist()
+        self._ms_adapter = manual_stepper_dispatch.get_adapter(self.name)
 
     def _initialize_loggers(self):
         mms_logger = printer_adapter.get_mms_logger()
@@ -335,23 +454,42 @@ class MMSStepper:
 
     def pause(self, period_seconds):
         self.reactor.pause(
-            self.reactor.monotonic() + period_seconds
+            self._monotonic() + period_seconds
         )
 
     # ---- Printer Objects ----
     def get_mcu(self):
-        if not self._mcu:
-            self._mcu = self.get_mcu_stepper().get_mcu()
         return self._mcu
 
     def get_mcu_stepper(self):
         # Get stepper.MCU_stepper
-        if not self._mcu_stepper:
-            self._mcu_stepper = force_move_a.get_mcu_stepper(self.name)
         return self._mcu_stepper
 
+    def get_trapq(self):
+        if self._trapq is None:
+            self._trapq = motion_queuing_a.allocate_trapq()
+        return self._trapq
+
+    def get_ms_adapter(self):
+        # Get adapters.ManualStepperAdapter
+        return self._ms_adapter
+
     def get_mcu_stepper_status(self):
-        mcu_stepper = self.get_mcu_stepper()
+        mcu_stepper = self._mcu_stepper
+        template = self._mcu_stepper_status_template
+        if template is None:
+            template = self._build_mcu_stepper_status_template()
+            self._mcu_stepper_status_template = template
+
+        status = template.copy()
+        status["commanded_position"] = mcu_stepper.get_commanded_position()
+        status["mcu_position"] = mcu_stepper.get_mcu_position()
+        return status
+
+    def _build_mcu_stepper_status_template(self):
+        mcu_stepper = self._mcu_stepper
+        rotation_distance, steps_per_rotation = \
+            mcu_stepper.get_rotation_distance()
         return {
             "name" : mcu_stepper.get_name(),
             # "units_in_radians" : mcu_stepper.units_in_radians(),
@@ -359,15 +497,15 @@ class MMSStepper:
             # "step_both_edge" : mcu_stepper.get_pulse_duration()[1],
 
             "oid" : mcu_stepper.get_oid(),
-            "step_dist" : mcu_stepper.get_step_dist(),
-            "rotation_distance" : mcu_stepper.get_rotation_distance()[0],
-            "steps_per_rotation" : mcu_stepper.get_rotation_distance()[1],
+            "step_dist" : self._step_dist,
+            "rotation_distance" : rotation_distance,
+            "steps_per_rotation" : steps_per_rotation,
 
             # "invert_dir" : mcu_stepper.get_dir_inverted()[0],
             # "orig_invert_dir" : mcu_stepper.get_dir_inverted()[1],
 
-            "commanded_position" : mcu_stepper.get_commanded_position(),
-            "mcu_position" : mcu_stepper.get_mcu_position(),
+            "commanded_position" : None,
+            "mcu_position" : None,
             # "past_mcu_position" : mcu_stepper.get_past_mcu_position(
             #     self._end_print_time),
 
@@ -377,11 +515,11 @@ class MMSStepper:
         }
 
     def get_step_dist(self):
-        return self.get_mcu_stepper().get_step_dist()
+        return self._step_dist
 
     def get_mcu_status(self):
-        mcu = self.get_mcu()
-        eventtime = self.reactor.monotonic()
+        mcu = self._mcu
+        eventtime = self._monotonic()
         clocksync = mcu._clocksync
         clock_adj = clocksync.clock_adj
         clock_est = clocksync.clock_est
@@ -389,24 +527,53 @@ class MMSStepper:
         print_time = mcu.clock_to_print_time(clock)
         # clock_re = mcu.print_time_to_clock(print_time)
 
-        return {
-            "name" : mcu.get_name(),
-            "freq" : mcu._mcu_freq,
-            "oid_count" : mcu._oid_count,
-            # "flush_callbacks" : mcu._flush_callbacks,
-            # "stepqueues" : mcu._stepqueues,
-            # "status_info" : mcu.get_status(),
-
-            "eventtime" : eventtime,
-            "adjusted_offset" : clock_adj[0],
-            "adjusted_freq" : clock_adj[1],
-            "clock_est(sample_time, clock, freq)" : clock_est,
-            "clock" : clock,
-            "print_time" : print_time,
-        }
+        template = self._mcu_status_template
+        if template is None:
+            template = {
+                "name" : mcu.get_name(),
+                "freq" : mcu._mcu_freq,
+                "oid_count" : mcu._oid_count,
+                # "flush_callbacks" : mcu._flush_callbacks,
+                # "stepqueues" : mcu._stepqueues,
+                # "status_info" : mcu.get_status(),
+            }
+            self._mcu_status_template = template
+
+        status = template.copy()
+        status["eventtime"] = eventtime
+        status["adjusted_offset"] = clock_adj[0]
+        status["adjusted_freq"] = clock_adj[1]
+        status["clock_est(sample_time, clock, freq)"] = clock_est
+        status["clock"] = clock
+        status["print_time"] = print_time
+        return status
 
     # ---- Stepper Status ----
     def get_status(self):
+        template = self._status_template
+        if template is None:
+            template = self._build_status_template()
+            if self._step_dist is not None:
+                # Only cache once the stepper is resolved in connect
+                self._status_template = template
+
+        status = template.copy()
+        status["focus_slot"] = self._focus_slot
+        status["is_running"] = self._is_running
+        status["forward"] = self._forward
+        status["move_type"] = MoveType.get_name(self.move_type)
+        status["move_status"] = MoveStatus.NAMES[self.move_status]
+        dispatch = self._active_dispatch
+        if dispatch is not None:
+            status["steps_moved"] = dispatch.steps_moved
+            status["distance_moved"] = round(dispatch.distance_moved, 4)
+        else:
+            status["steps_moved"] = 0
+            status["distance_moved"] = 0
+        return status
+
+    def _build_status_template(self):
+        # Static fields are filled, placeholders keep the key order
         return {
             "index" : self._index,
             # Klipper config section name of stepper
@@ -414,30 +581,35 @@ class MMSStepper:
             # MMS name of stepper
             "mms_name" : self.mms_name,
             # The focusing slot of stepper
-            "focus_slot" : self._focus_slot,
-            "is_running" : self._is_running,
-            "forward" : self._forward,
+            "focus_slot" : None,
+            "is_running" : None,
+            "forward" : None,
 
             # Current move statement
-            "move_type" : self.move_type,
-            "move_status" : self.move_status,
+            "move_type" : None,
+            "move_status" : None,
 
-            # Distance per step
-            "step_dist" : round(self.get_step_dist(), 4),
+            # Distance per step, None before klippy connect
+            "step_dist" : (round(self._step_dist, 4)
+                           if self._step_dist is not None else None),
             # The steps stepper current/last moved
-            "steps_moved" : self.get_steps_moved(),
+            "steps_moved" : None,
             # The distinces stepper current/last moved
-            "distance_moved" : round(self.get_distance_moved(), 4),
+            "distance_moved" : None,
         }
 
     def log_status(self):
-        self.log_info(json.dumps(self.get_status(), indent=4))
+        # Skip the json dumps if nothing consumes the message
+        if self.log_info.is_enabled():
+            self.log_info(json.dumps(self.get_status(), indent=4))
 
     def get_name(self):
         return self.name
 
     def set_index(self, index):
         self._index = index
+        # Rebuild status template with new index
+        self._status_template = None
 
     def get_index(self):
         return self._index
@@ -449,60 +621,63 @@ class MMSStepper:
         return self._focus_slot
 
     def get_dispatch(self, move_type=None):
-        mv_type = move_type or self.move_type
-        return self.move_dispatch_dct.get(mv_type, None)
+        if move_type is None:
+            return self._active_dispatch
+        return self.move_dispatch_lst[move_type]
 
     def get_steps_moved(self):
-        dispatch = self.get_dispatch()
+        dispatch = self._active_dispatch
         return dispatch.steps_moved if dispatch else 0
 
     def get_distance_moved(self):
-        dispatch = self.get_dispatch()
+        dispatch = self._active_dispatch
         return dispatch.distance_moved if dispatch else 0
 
     def get_position(self):
         # Return current position
-        return self.get_mcu_stepper().get_commanded_position()
+        return self._mcu_stepper.get_commanded_position()
 
     def get_step(self):
         # Return current MCU steps
-        return self.get_mcu_stepper().get_mcu_position()
+        return self._mcu_stepper.get_mcu_position()
 
     def reset_position(self):
         # Reset position to avoid "Stepcompress error"
-        self.get_mcu_stepper().set_position((0., 0., 0.))
+        self._mcu_stepper.set_position((0., 0., 0.))
         # Notice: ManualStepper may save ManualStepper.commanded_pos
         # itself, which use to calculate distance in homing.
         # So update position not only with MCU_Stepper but alse ManualStepper.
-        ms_adapter = manual_stepper_dispatch.get_adapter(self.name)
-        ms_adapter.reset_position()
+        self._ms_adapter.reset_position()
 
     def set_trapq(self, trapq):
-        return self.get_mcu_stepper().set_trapq(trapq)
+        return self._mcu_stepper.set_trapq(trapq)
 
     def move_is_completed(self, move_status=None):
-        move_status = move_status or self.move_status
+        if move_status is None:
+            return self.move_status == MoveStatus.COMPLETED
         return move_status == MoveStatus.COMPLETED
 
     def move_is_terminated(self, move_status=None):
-        move_status = move_status or self.move_status
+        if move_status is None:
+            return self.move_status == MoveStatus.TERMINATED
         return move_status == MoveStatus.TERMINATED
 
     def move_is_error(self, move_status=None):
-        move_status = move_status or self.move_status
+        if move_status is None:
+            return self.move_status == MoveStatus.ERROR
         return move_status == MoveStatus.ERROR
 
     def is_homing_to(self, mcu_pin):
-        mt_home = MoveType.MANUAL_HOME
-        dispatch = self.get_dispatch(mt_home)
-        return self.move_status is MoveStatus.MOVING \
-            and self.move_type is mt_home \
-            and dispatch.is_destination(mcu_pin)
+        return self.move_status == MoveStatus.MOVING \
+            and self.move_type == MoveType.MANUAL_HOME \
+            and self._manual_home_dispatch.is_destination(mcu_pin)
 
     # ---- Control ----
     def _cal_enable_print_time(self):
-        cal_pt = self._cal_print_time(add_interval=False)
-        th_pt = toolhead_a.get_print_time()
+        # Only reached when the motor state really changes, see enable()
+        # and disable(), so read both clocks fresh here
+        cal_pt = self._mcu.estimated_print_time(self._monotonic())
+        th_pt = _th_get_print_time()
         # self.log_info(
         #     f"[{self.mms_name}] print_time:{cal_pt:.2f}, "
         #     f"toolhead print_time:{th_pt:.2f}"
@@ -510,20 +685,20 @@ class MMSStepper:
         return max(cal_pt, th_pt)
 
     def enable(self):
-        if not stepper_enable_a.is_motor_enabled(self.name):
+        if not _se_is_enabled(self.name):
             pt = self._cal_enable_print_time()
-            res = stepper_enable_a.enable(self.name, pt)
+            res = _se_enable(self.name, pt)
             if res:
-                self.log_info(f"[{self.mms_name}] enable at"
-                              f" print_time:{pt:.2f}")
+                self.log_info("[%s] enable at print_time:%.2f",
+                              self.mms_name, pt)
 
     def disable(self):
-        if stepper_enable_a.is_motor_enabled(self.name):
+        if _se_is_enabled(self.name):
             pt = self._cal_enable_print_time()
-            res = stepper_enable_a.disable(self.name, pt)
+            res = _se_disable(self.name, pt)
             if res:
-                self.log_info(f"[{self.mms_name}] disable at"
-                              f" print_time:{pt:.2f}")
+                self.log_info("[%s] disable at print_time:%.2f",
+                              self.mms_name, pt)
 
     def _reset_move_status(self, move_type):
         self.move_status = move_type
@@ -532,7 +707,8 @@ class MMSStepper:
 
     def _update_move_status(self, move_type):
         self.move_status = move_type
-        self.move_end_at = time.time()
+        # Reactor clock, same source as the rest of the stepper
+        self.move_end_at = self._monotonic()
         self.move_end_steps = self.get_steps_moved()
 
     @contextmanager
@@ -556,19 +732,20 @@ class MMSStepper:
             return
 
         self.move_type = move_type
+        self._active_dispatch = self.move_dispatch_lst[move_type]
         self._is_running = True
         self._reset_move_status(MoveStatus.MOVING)
-        printer_adapter.notify_mms_stepper_running()
-        # Force enable stepper before run
-        self.enable()
+        _notify_running()
         try:
+            # Force enable stepper before run
+            self.enable()
             yield True
         finally:
             self._is_running = False
             if self.move_status == MoveStatus.MOVING:
                 # Not completed or terminated, mark as expired
                 self._update_move_status(MoveStatus.EXPIRED)
-            printer_adapter.notify_mms_stepper_idle()
+            _notify_idle()
 
     def _cal_print_time(self, add_interval=True):
         """
@@ -578,22 +755,25 @@ class MMSStepper:
         Returns:
             float: The final estimated print time.
         """
-        print_time = self.get_mcu().estimated_print_time(
-            self.reactor.monotonic()
-        )
+        print_time = self._mcu.estimated_print_time(self._monotonic())
         if add_interval:
-            print_time += self.s_config.interval_time
+            print_time += self.interval_time
         return print_time
 
     def _adjust_print_time(self):
         print_time = self._cal_print_time()
-        if print_time < self._end_print_time:
+        end_print_time = self._end_print_time
+        if not end_print_time:
+            # First move, no previous round to wait for
+            return print_time
+
+        if print_time < end_print_time:
             # Last round is not done yet
             # Wait to avoid "Stepcompress error"
-            wait_time = (self._end_print_time - print_time
-                         + self.s_config.wait_delay)
-            self.log_info(f"[{self.mms_name}] {self.move_type}"
-                          f" wait:{wait_time:.2f}...")
+            wait_time = (end_print_time - print_time
+                         + self.wait_delay)
+            self.log_info("[%s] %s wait:%.2f...", self.mms_name,
+                          MoveType.get_name(self.move_type), wait_time)
             # Wait to flush print_time
             self.pause(wait_time)
             # Calculate new print_time
@@ -601,15 +781,15 @@ class MMSStepper:
         return print_time
 
     def _sync_print_time(self):
-        toolhead_pt = toolhead_a.get_print_time()
+        toolhead_pt = _th_get_print_time()
         gap = self._end_print_time - toolhead_pt
 
         if gap < 0:
-            self.log_info(f"[{self.mms_name}] flush:{abs(gap):.2f}...")
+            self.log_info("[%s] flush:%.2f...", self.mms_name, -gap)
             self._end_print_time = toolhead_pt
         elif gap > 0:
-            self.log_info(f"toolhead dwell:{gap:.2f}...")
-            toolhead_a.dwell(gap)
+            self.log_info("toolhead dwell:%.2f...", gap)
+            _th_dwell(gap)
 
     # ---- Public Movement Methods ----
     # -- Manual Move --
@@ -620,8 +800,7 @@ class MMSStepper:
         with self._stepper_is_running(mv_type) as can_run:
             if can_run:
                 print_time = self._adjust_print_time()
-                dispatch = self.get_dispatch(mv_type)
-                self._end_print_time = dispatch.execute(
+                self._end_print_time = self._manual_move_dispatch.execute(
                     print_time, distance, speed, accel)
                 # self.log_status()
 
@@ -637,7 +816,7 @@ class MMSStepper:
             if can_run:
                 self._can_calibrate = True
                 self._sync_print_time()
-                dispatch = self.get_dispatch(mv_type)
+                dispatch = self._manual_home_dispatch
 
                 try:
                     endstop_name = dispatch.execute(
@@ -684,8 +863,7 @@ class MMSStepper:
         with self._stepper_is_running(mv_type) as can_run:
             if can_run:
                 print_time = self._adjust_print_time()
-                dispatch = self.get_dispatch(mv_type)
-                self._end_print_time = dispatch.execute(
+                self._end_print_time = self._drip_move_dispatch.execute(
                     print_time, distance, speed, accel)
 
     def terminate_drip_move(self):
@@ -695,17 +873,21 @@ class MMSStepper:
                 "terminate failed"
             )
             return
-        self.get_dispatch(MoveType.DRIP_MOVE).terminate()
+        self._drip_move_dispatch.terminate()
         self._update_move_status(MoveStatus.TERMINATED)
 
 
 class MMSSelector(MMSStepper):
+    __slots__ = ()
+
     def __init__(self, name):
         super().__init__(name)
         self.mms_name = "Selector"
 
 
 class MMSDrive(MMSStepper):
+    __slots__ = ()
+
     def __init__(self, name):
         super().__init__(name)
         self.mms_name = "Drive"
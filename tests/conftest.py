@@ -0,0 +1,76 @@
+# Test setup for MMS hardware modules
+#
+# This file may be distributed under the terms of the GNU GPLv3 license.
+
+import importlib.util
+import os
+import sys
+import types
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HARDWARE_DIR = os.path.join(ROOT_DIR, "klippy", "extras", "mms", "hardware")
+PKG = "mms_test"
+
+
+def _load_mfrc522():
+    """
+    Load hardware/mfrc522.py alone, without the klippy package.
+    Its only klippy import is "from ...bus import MCU_SPI_from_config",
+    used by the sample MFRC522 class, so an empty "bus" is registered
+    in a package skeleton of the same depth.
+    """
+    for name in (PKG, f"{PKG}.extras", f"{PKG}.extras.mms",
+                 f"{PKG}.extras.mms.hardware"):
+        pkg = types.ModuleType(name)
+        pkg.__path__ = []
+        sys.modules[name] = pkg
+
+    bus = types.ModuleType(f"{PKG}.extras.bus")
+    bus.MCU_SPI_from_config = None
+    sys.modules[bus.__name__] = bus
+
+    name = f"{PKG}.extras.mms.hardware.mfrc522"
+    spec = importlib.util.spec_from_file_location(
+        name, os.path.join(HARDWARE_DIR, "mfrc522.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class FakeSPI:
+    """
+    Stand-in of klippy MCU_SPI, records sent frames and answers
+    spi_transfer() like klippy does: "response" is a list of ints
+    as long as the sent frame.
+    """
+    def __init__(self):
+        self.sent = []
+        # Bytes returned after the first (address) byte of a transfer
+        self.read_bytes = []
+
+    def spi_send(self, data):
+        self.sent.append(list(data))
+
+    def spi_transfer(self, data):
+        self.sent.append(list(data))
+        payload = list(self.read_bytes)[:len(data) - 1]
+        payload += [0] * (len(data) - 1 - len(payload))
+        return {"response": [0] + payload}
+
+
+@pytest.fixture(scope="session")
+def mfrc522():
+    return _load_mfrc522()
+
+
+@pytest.fixture
+def fake_spi():
+    return FakeSPI()
+
+
+@pytest.fixture
+def handler(mfrc522, fake_spi):
+    return mfrc522.MFRC522Handler(fake_spi)
@@ -0,0 +1,122 @@
+# Tests for MFRC522 handler, RFID cache and hash assistant
+#
+# This file may be distributed under the terms of the GNU GPLv3 license.
+
+import hashlib
+import time
+
+
+# ---- MFRC522Handler ----
+def test_handler_builds_fifo_read_frames(handler):
+    fifo_read_addr = (handler.config.MOD_HIGH
+                      | handler.get_reg_addr("REG_FIFO_DATA"))
+    assert len(handler._fifo_read_tx) == 65
+    assert handler._fifo_read_tx[0] == [0x00]
+    assert handler._fifo_read_tx[3] == [fifo_read_addr] * 3 + [0x00]
+
+
+def test_software_crc_a(handler):
+    # MIFARE READ block 0 frame is 30 00 02 A8
+    assert handler.pcd_calculate_CRC([0x30, 0x00]) == [0x02, 0xA8]
+    assert list(handler._read_crcs[0]) == [0x02, 0xA8]
+
+
+def test_read_fifo_burst_with_list_response(handler, fake_spi):
+    fake_spi.read_bytes = [0x11, 0x22, 0x33]
+    data = handler.read_fifo_burst(3)
+    assert isinstance(data, bytearray)
+    assert data == bytearray([0x11, 0x22, 0x33])
+    assert handler.read_fifo_burst(0) == bytearray()
+
+
+def _stub_tag_io(handler, read_block):
+    handler.pcd_authenticate = lambda **kwargs: None
+    handler.pcd_stop_crypto_1 = lambda: None
+    handler.read_block = read_block
+
+
+def test_read_all_blocks_into_list_blocks(handler):
+    # read_block() returns a list of ints, as pcd_to_picc() builds it
+    _stub_tag_io(handler, lambda block_num: [block_num] * 16)
+    buf = bytearray(64 * 16)
+
+    mask = handler.read_all_blocks_into([1, 2, 3, 4], buf)
+
+    assert mask == handler.config.ALL_BLOCKS_MASK
+    assert buf[5 * 16:6 * 16] == bytes([5] * 16)
+    assert handler.read_all_buffer_loop([1, 2, 3, 4]) == buf
+
+
+def test_read_all_blocks_into_stops_at_short_block(handler):
+    def read_block(block_num):
+        return [0xAA] * (8 if block_num == 2 else 16)
+
+    _stub_tag_io(handler, read_block)
+    buf = bytearray(64 * 16)
+
+    mask = handler.read_all_blocks_into([1, 2, 3, 4], buf)
+
+    assert mask == 0b11
+    assert buf[2 * 16:] == bytearray(62 * 16)
+
+
+# ---- RFIDCache ----
+def test_cache_evicts_oldest(mfrc522):
+    cache = mfrc522.RFIDCache(max_size=2)
+    cache.add("a", 1)
+    cache.add("b", 2)
+    cache.add("c", 3)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+
+
+def test_cache_slru_keeps_protected(mfrc522):
+    cache = mfrc522.RFIDCache(max_size=3, protected_size=1)
+    cache.add("hot", 1)
+    # Hit in probation, promoted to protected
+    assert cache.get("hot") == 1
+    for key in ("x", "y", "z"):
+        cache.add(key, key)
+    assert cache.get("hot") == 1
+    assert cache.get("x") is None
+
+
+def test_cache_verify_drops_changed_buffer(mfrc522):
+    cache = mfrc522.RFIDCache(verify=True)
+    blocks = bytearray(b"\x01" * 32)
+    cache.add("blocks", (blocks, "HASH"))
+    cache.add("json", '{"a": 1}')
+    assert cache.get("blocks") == (blocks, "HASH")
+    assert cache.get("json") == '{"a": 1}'
+
+    blocks[0] = 0xFF
+    assert cache.get("blocks") is None
+    assert cache.get("json") == '{"a": 1}'
+
+
+def test_cache_get_fresh_ttl(mfrc522):
+    cache = mfrc522.RFIDCache(verify=True)
+    cache.add_timed("uid", ("HASH", "json"))
+    assert cache.get_fresh("uid", ttl=10) == ("HASH", "json")
+
+    cache.add("old", (time.monotonic() - 5, "val"))
+    assert cache.get_fresh("old", ttl=1) is None
+
+
+# ---- HashAssistant ----
+def test_hash_as_string_is_sha256(mfrc522):
+    assistant = mfrc522.HashAssistant()
+    data = bytes(range(256)) * 4
+    assert assistant.hash_as_string(memoryview(data)[:960]) == \
+        hashlib.sha256(data[:960]).hexdigest().upper()
+
+
+def test_check_hash(mfrc522):
+    assistant = mfrc522.HashAssistant()
+    valid = hashlib.sha256(b"mms").hexdigest().upper()
+    assert assistant.check_hash(valid) is None
+    assert assistant.check_hash(valid[:-2]) == "has wrong length"
+    assert assistant.check_hash("G" + valid[1:]) == "is not hex"
+    assert assistant.check_hash("0" * 60 + valid[:4]) == \
+        "has high zero ratio"